@@ -43,7 +43,9 @@ function reduce(n: number): number {
   if (n === 11 || n === 22 || n === 33) return n;
   let v = Math.abs(Math.round(n));
   while (v > 9) {
-    const next = String(v).split('').reduce((a, d) => a + Number(d), 0);
+    // Digit sum in integer arithmetic, without a string and array per step
+    let next = 0;
+    for (let rest = v; rest > 0; rest = Math.floor(rest / 10)) next += rest % 10;
     if (next === 11 || next === 22 || next === 33) return next;
     v = next;
   }
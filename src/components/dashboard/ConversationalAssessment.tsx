@@ -90,7 +90,7 @@ ${ASSESSMENT_STAGES[0].prompt}`;
   const getUserDisplayName = () => {
     if (!blueprintData?.user_meta) return 'Friend';
     return blueprintData.user_meta.preferred_name || 
-           blueprintData.user_meta.full_name?.split(' ')[0] || 
+           blueprintData.user_meta.full_name?.split(' ', 1)[0] || 
            'Friend';
   };
 
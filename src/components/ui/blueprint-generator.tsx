@@ -63,7 +63,7 @@ export const BlueprintGenerator: React.FC<BlueprintGeneratorProps> = ({
         // Create user data object for blueprint generation
         const userData = {
           full_name: formData.name,
-          preferred_name: formData.name.split(" ")[0], // Use first name as preferred name
+          preferred_name: formData.name.split(" ", 1)[0], // Use first name as preferred name
           birth_date: formData.birthDate,
           birth_time_local: formData.birthTime,
           birth_location: formData.birthLocation,
@@ -187,7 +187,7 @@ export const BlueprintGenerator: React.FC<BlueprintGeneratorProps> = ({
         // Create user data object for blueprint generation
         const userData = {
           full_name: formData.name,
-          preferred_name: formData.name.split(" ")[0],
+          preferred_name: formData.name.split(" ", 1)[0],
           birth_date: formData.birthDate,
           birth_time_local: formData.birthTime,
           birth_location: formData.birthLocation,
@@ -26,7 +26,7 @@ export const useAICoach = () => {
 
   // Get user's display name
   const userName = user?.user_metadata?.preferred_name || 
-                   user?.user_metadata?.full_name?.split(' ')[0] || 
+                   user?.user_metadata?.full_name?.split(' ', 1)[0] || 
                    user?.email?.split('@')[0] || 
                    'friend';
   
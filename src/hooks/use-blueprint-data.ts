@@ -1,6 +1,7 @@
 
 import { useState, useEffect } from 'react';
 import { blueprintService } from '@/services/blueprint-service';
+import { MBTI_FUNCTION_NAMES } from '@/utils/mbti-cognitive-functions';
 
 interface PersonalityData {
   likelyType?: string;
@@ -10,6 +11,8 @@ interface PersonalityData {
   mbtiProbabilities?: any;
 }
 
+const UNKNOWN_MBTI_FUNCTIONS = Object.freeze({ dominant: 'Unknown', auxiliary: 'Unknown' });
+
 export const useBlueprintData = () => {
   const [blueprintData, setBlueprintData] = useState<any>(null);
   const [loading, setLoading] = useState(true);
@@ -52,30 +55,7 @@ export const useBlueprintData = () => {
           return keywords.length > 0 ? keywords : ['Authentic', 'Empathetic'];
         };
 
-        // Map MBTI functions based on type
-        const getMBTIFunctions = (type: string) => {
-          const functionMap: { [key: string]: { dominant: string; auxiliary: string } } = {
-            'INFP': { dominant: 'Introverted Feeling', auxiliary: 'Extraverted Intuition' },
-            'ENFP': { dominant: 'Extraverted Intuition', auxiliary: 'Introverted Feeling' },
-            'INFJ': { dominant: 'Introverted Intuition', auxiliary: 'Extraverted Feeling' },
-            'ENFJ': { dominant: 'Extraverted Feeling', auxiliary: 'Introverted Intuition' },
-            'INTJ': { dominant: 'Introverted Intuition', auxiliary: 'Extraverted Thinking' },
-            'ENTJ': { dominant: 'Extraverted Thinking', auxiliary: 'Introverted Intuition' },
-            'INTP': { dominant: 'Introverted Thinking', auxiliary: 'Extraverted Intuition' },
-            'ENTP': { dominant: 'Extraverted Intuition', auxiliary: 'Introverted Thinking' },
-            'ISFP': { dominant: 'Introverted Feeling', auxiliary: 'Extraverted Sensing' },
-            'ESFP': { dominant: 'Extraverted Sensing', auxiliary: 'Introverted Feeling' },
-            'ISFJ': { dominant: 'Introverted Sensing', auxiliary: 'Extraverted Feeling' },
-            'ESFJ': { dominant: 'Extraverted Feeling', auxiliary: 'Introverted Sensing' },
-            'ISTJ': { dominant: 'Introverted Sensing', auxiliary: 'Extraverted Thinking' },
-            'ESTJ': { dominant: 'Extraverted Thinking', auxiliary: 'Introverted Sensing' },
-            'ISTP': { dominant: 'Introverted Thinking', auxiliary: 'Extraverted Sensing' },
-            'ESTP': { dominant: 'Extraverted Sensing', auxiliary: 'Introverted Thinking' }
-          };
-          return functionMap[type] || { dominant: 'Unknown', auxiliary: 'Unknown' };
-        };
-
-        const functions = getMBTIFunctions(mbtiType);
+        const functions = MBTI_FUNCTION_NAMES[mbtiType] || UNKNOWN_MBTI_FUNCTIONS;
         
         const compatibleData = {
           ...data,
@@ -165,7 +145,7 @@ export const useBlueprintData = () => {
     }
     
     if (userMeta.full_name && typeof userMeta.full_name === 'string' && userMeta.full_name.trim()) {
-      const firstName = userMeta.full_name.trim().split(' ')[0];
+      const firstName = userMeta.full_name.trim().split(' ', 1)[0];
       if (firstName && firstName.length > 2) { // Avoid initials or very short strings
         console.log('🎯 getDisplayName: Using first part of full_name:', firstName);
         return firstName;
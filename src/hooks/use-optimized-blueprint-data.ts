@@ -95,7 +95,7 @@ export const useOptimizedBlueprintData = () => {
 
   const getDisplayName = useMemo(() => {
     const name = blueprintData?.user_meta?.preferred_name || 
-                 blueprintData?.user_meta?.full_name?.split(' ')[0] || 
+                 blueprintData?.user_meta?.full_name?.split(' ', 1)[0] || 
                  'User';
     console.log('👤 OPTIMIZED HOOK: Display name extracted:', name);
     return name;
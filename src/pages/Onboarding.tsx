@@ -1,4 +1,4 @@
-import React, { useState, useEffect, useRef } from "react";
+import React, { useState, useEffect, useRef, useMemo } from "react";
 import { useNavigate } from "react-router-dom";
 import { motion } from "@/lib/framer-motion";
 import { Button } from "@/components/ui/button";
@@ -23,6 +23,22 @@ import { LanguageSelectionStep } from "@/components/onboarding/LanguageSelection
 import { userLanguagePreferenceService } from "@/services/user-language-preference-service";
 import { useJourneyTracking } from "@/hooks/use-onboarding-journey-tracking";
 
+// Month options for the birth date picker
+const MONTHS = [
+  { value: "01", label: "January" },
+  { value: "02", label: "February" },
+  { value: "03", label: "March" },
+  { value: "04", label: "April" },
+  { value: "05", label: "May" },
+  { value: "06", label: "June" },
+  { value: "07", label: "July" },
+  { value: "08", label: "August" },
+  { value: "09", label: "September" },
+  { value: "10", label: "October" },
+  { value: "11", label: "November" },
+  { value: "12", label: "December" }
+];
+
 export default function Onboarding() {
   const navigate = useNavigate();
   const { toast } = useToast();
@@ -92,25 +108,15 @@ export default function Onboarding() {
     t('onboarding.choosePath'),
   ];
 
-  // Generate months array with translations
-  const months = [
-    { value: "01", label: "January" },
-    { value: "02", label: "February" },
-    { value: "03", label: "March" },
-    { value: "04", label: "April" },
-    { value: "05", label: "May" },
-    { value: "06", label: "June" },
-    { value: "07", label: "July" },
-    { value: "08", label: "August" },
-    { value: "09", label: "September" },
-    { value: "10", label: "October" },
-    { value: "11", label: "November" },
-    { value: "12", label: "December" }
-  ];
-
-  // Generate years array (from 1920 to current year)
-  const currentYear = new Date().getFullYear();
-  const years = Array.from({ length: currentYear - 1919 }, (_, i) => currentYear - i);
+  // Generate years array (from 1920 to current year) once per mount rather
+  // than on every keystroke re-render
+  const { currentYear, years } = useMemo(() => {
+    const currentYear = new Date().getFullYear();
+    return {
+      currentYear,
+      years: Array.from({ length: currentYear - 1919 }, (_, i) => currentYear - i)
+    };
+  }, []);
 
   // Navigation functions with journey tracking
   const goToNextStep = async () => {
@@ -621,7 +627,7 @@ export default function Onboarding() {
                         <SelectValue placeholder={t('onboarding.month')} />
                       </SelectTrigger>
                       <SelectContent>
-                        {months.map((month) => (
+                        {MONTHS.map((month) => (
                           <SelectItem key={month.value} value={month.value}>
                             {month.label}
                           </SelectItem>
@@ -802,7 +808,7 @@ export default function Onboarding() {
               key={`blueprint-generator-${blueprintGenerated ? 'complete' : 'active'}`}
               userProfile={{
                 full_name: formData.name || "Anonymous User",
-                preferred_name: formData.name.split(" ")[0], // Use first name as preferred name
+                preferred_name: formData.name.split(" ", 1)[0], // Use first name as preferred name
                 birth_date: formData.birthDate,
                 birth_time_local: formData.birthTime,
                 birth_location: formData.birthLocation,
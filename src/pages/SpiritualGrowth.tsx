@@ -94,7 +94,7 @@ const SpiritualGrowth = () => {
   const getUserDisplayName = () => {
     if (!blueprintData?.user_meta) return 'Friend';
     return blueprintData.user_meta.preferred_name || 
-           blueprintData.user_meta.full_name?.split(' ')[0] || 
+           blueprintData.user_meta.full_name?.split(' ', 1)[0] || 
            'Friend';
   };
 
@@ -454,8 +454,9 @@ class ACSRealAIIntegrationService implements ACSRealAIIntegration {
 
   // NEW: Generate consistent user ID for session continuity
   private getConsistentUserId(sessionId: string): string {
-    if (this.sessionUserMap.has(sessionId)) {
-      return this.sessionUserMap.get(sessionId)!;
+    const existingUserId = this.sessionUserMap.get(sessionId);
+    if (existingUserId) {
+      return existingUserId;
     }
     
     // Generate deterministic user ID based on session
@@ -41,6 +41,15 @@ interface BlueprintMemory {
   version: string;
 }
 
+// Short Human Design strategy label per type
+const HD_STRATEGIES = Object.freeze({
+  'Manifestor': 'Inform before acting',
+  'Generator': 'Respond to life',
+  'Manifesting Generator': 'Respond and inform',
+  'Projector': 'Wait for invitation',
+  'Reflector': 'Wait a lunar cycle'
+});
+
 export class BlueprintEmbeddingService {
   private apiKey: string;
   private baseURL = 'https://api.openai.com/v1';
@@ -655,14 +664,7 @@ export class BlueprintEmbeddingService {
 
   // Blueprint Analysis Helpers
   private getHDStrategy(type?: string): string {
-    const strategies = {
-      'Manifestor': 'Inform before acting',
-      'Generator': 'Respond to life',
-      'Manifesting Generator': 'Respond and inform',
-      'Projector': 'Wait for invitation',
-      'Reflector': 'Wait a lunar cycle'
-    };
-    return strategies[type as keyof typeof strategies] || 'Follow intuition';
+    return HD_STRATEGIES[type as keyof typeof HD_STRATEGIES] || 'Follow intuition';
   }
 
   private deriveNaturalRhythm(blueprint: LayeredBlueprint): string {
@@ -212,70 +212,76 @@ export class BlueprintEnhancementService {
     return [...new Set(allChannels)];
   }
 
+  // Lookup tables for the section text, built once rather than on every call
+  private static readonly PROFILE_DESCRIPTIONS: Readonly<Record<string, string>> = {
+    '1/3': 'investigate and experiment through trial and error',
+    '1/4': 'investigate and influence others through relationships',
+    '2/4': 'develop natural talents and share them through relationships',
+    '2/5': 'develop talents and project solutions to others',
+    '3/5': 'experiment and project solutions through experience',
+    '3/6': 'experiment, transition, and become a role model',
+    '4/6': 'influence through relationships and become a role model',
+    '5/1': 'project solutions while investigating foundations',
+    '5/2': 'project solutions while developing natural talents',
+    '6/2': 'be a role model while developing natural talents',
+    '6/3': 'be a role model through experimentation'
+  };
+
   private static getProfileDescription(profile: string): string {
-    const profiles: Record<string, string> = {
-      '1/3': 'investigate and experiment through trial and error',
-      '1/4': 'investigate and influence others through relationships',
-      '2/4': 'develop natural talents and share them through relationships',
-      '2/5': 'develop talents and project solutions to others',
-      '3/5': 'experiment and project solutions through experience',
-      '3/6': 'experiment, transition, and become a role model',
-      '4/6': 'influence through relationships and become a role model',
-      '5/1': 'project solutions while investigating foundations',
-      '5/2': 'project solutions while developing natural talents',
-      '6/2': 'be a role model while developing natural talents',
-      '6/3': 'be a role model through experimentation'
-    };
-    return profiles[profile.split(' ')[0]] || 'live authentically';
+    return this.PROFILE_DESCRIPTIONS[profile.split(' ')[0]] || 'live authentically';
   }
 
+  private static readonly ANIMAL_TRAITS: Readonly<Record<string, string>> = {
+    'Rat': 'clever and resourceful',
+    'Ox': 'reliable and determined',
+    'Tiger': 'brave and competitive',
+    'Rabbit': 'gentle and compassionate',
+    'Dragon': 'confident and ambitious',
+    'Snake': 'wise and intuitive',
+    'Horse': 'energetic and independent',
+    'Goat': 'creative and peaceful',
+    'Monkey': 'clever and versatile',
+    'Rooster': 'confident and hardworking',
+    'Dog': 'loyal and honest',
+    'Pig': 'generous and compassionate'
+  };
+
   private static getAnimalTraits(animal: string): string {
-    const traits: Record<string, string> = {
-      'Rat': 'clever and resourceful',
-      'Ox': 'reliable and determined',
-      'Tiger': 'brave and competitive',
-      'Rabbit': 'gentle and compassionate',
-      'Dragon': 'confident and ambitious',
-      'Snake': 'wise and intuitive',
-      'Horse': 'energetic and independent',
-      'Goat': 'creative and peaceful',
-      'Monkey': 'clever and versatile',
-      'Rooster': 'confident and hardworking',
-      'Dog': 'loyal and honest',
-      'Pig': 'generous and compassionate'
-    };
-    return traits[animal] || 'unique';
+    return this.ANIMAL_TRAITS[animal] || 'unique';
   }
 
+  private static readonly ELEMENT_TRAITS: Readonly<Record<string, string>> = {
+    'Wood': 'growing and flexible',
+    'Fire': 'passionate and dynamic',
+    'Earth': 'stable and nurturing',
+    'Metal': 'precise and structured',
+    'Water': 'flowing and adaptable'
+  };
+
   private static getElementTraits(element: string): string {
-    const traits: Record<string, string> = {
-      'Wood': 'growing and flexible',
-      'Fire': 'passionate and dynamic',
-      'Earth': 'stable and nurturing',
-      'Metal': 'precise and structured',
-      'Water': 'flowing and adaptable'
-    };
-    return traits[element] || 'balanced';
+    return this.ELEMENT_TRAITS[element] || 'balanced';
   }
 
+  private static readonly ELEMENT_GOVERNING: Readonly<Record<string, string>> = {
+    'Wood': 'growth, flexibility, and expansion',
+    'Fire': 'transformation, passion, and illumination',
+    'Earth': 'stability, nourishment, and grounding',
+    'Metal': 'structure, precision, and refinement',
+    'Water': 'flow, adaptability, and depth'
+  };
+
   private static getElementGoverning(element: string): string {
-    const governing: Record<string, string> = {
-      'Wood': 'growth, flexibility, and expansion',
-      'Fire': 'transformation, passion, and illumination',
-      'Earth': 'stability, nourishment, and grounding',
-      'Metal': 'structure, precision, and refinement',
-      'Water': 'flow, adaptability, and depth'
-    };
-    return governing[element] || 'balance';
+    return this.ELEMENT_GOVERNING[element] || 'balance';
   }
 
+  private static readonly ANIMAL_ARCHETYPES: Readonly<Record<string, string>> = {
+    'Horse': 'freedom, movement, and independence',
+    'Dragon': 'power, transformation, and leadership',
+    'Tiger': 'courage, strength, and protection'
+  };
+
   private static getAnimalArchetype(animal: string): string {
-    const archetypes: Record<string, string> = {
-      'Horse': 'freedom, movement, and independence',
-      'Dragon': 'power, transformation, and leadership',
-      'Tiger': 'courage, strength, and protection'
-    };
-    return archetypes[animal] || 'natural wisdom';
+    return this.ANIMAL_ARCHETYPES[animal] || 'natural wisdom';
   }
 
   private static findRetrogrades(celestialData: any): string[] {
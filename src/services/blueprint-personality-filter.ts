@@ -13,6 +13,14 @@ interface FilteredResponse {
   blueprintReferences: string[];
 }
 
+// Human Design strategy guidance per type, shared with SoulSyncService
+export const HD_STRATEGIES = Object.freeze({
+  'Generator': 'respond to what lights you up and follow your gut',
+  'Projector': 'wait for invitation and recognition before sharing your gifts',
+  'Manifestor': 'initiate when you feel the urge, but inform others of your actions',
+  'Reflector': 'wait a full lunar cycle before making major decisions'
+});
+
 export class BlueprintPersonalityFilter {
   private blueprint: LayeredBlueprint;
   private userName: string;
@@ -268,13 +276,7 @@ Would you like me to dive deeper into any specific aspect of your blueprint? I c
   }
 
   private getHumanDesignStrategy(type: string): string {
-    const strategies = {
-      'Generator': 'respond to what lights you up and follow your gut',
-      'Projector': 'wait for invitation and recognition before sharing your gifts',
-      'Manifestor': 'initiate when you feel the urge, but inform others of your actions',
-      'Reflector': 'wait a full lunar cycle before making major decisions'
-    };
-    return strategies[type as keyof typeof strategies] || 'follow your natural energy flow';
+    return HD_STRATEGIES[type as keyof typeof HD_STRATEGIES] || 'follow your natural energy flow';
   }
 
   private getAuthorityGuidance(authority: string): string {
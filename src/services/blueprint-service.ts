@@ -314,7 +314,7 @@ class BlueprintService {
 
       const profileWithDefaults = {
         ...userProfile,
-        preferred_name: userProfile.preferred_name || userProfile.full_name.split(' ')[0],
+        preferred_name: userProfile.preferred_name || userProfile.full_name.split(' ', 1)[0],
         user_id: user.id
       };
 
@@ -91,8 +91,9 @@ export class CoachMessageParser {
   static parseMessage(content: string): ParsedCoachMessage {
     // Check cache first to prevent re-parsing
     const cacheKey = content.substring(0, 100);
-    if (this.parsedCache.has(cacheKey)) {
-      return this.parsedCache.get(cacheKey)!;
+    const cached = this.parsedCache.get(cacheKey);
+    if (cached) {
+      return cached;
     }
 
     // Filter out system prompts and internal messages
@@ -66,7 +66,7 @@ export class EnhancedPersonalityEngine {
     }
     
     if (fullName && typeof fullName === 'string' && fullName.trim()) {
-      const firstNameFromFull = fullName.trim().split(' ')[0];
+      const firstNameFromFull = fullName.trim().split(' ', 1)[0];
       if (firstNameFromFull && firstNameFromFull.length > 2) { // Avoid initials or very short strings
         console.log("🎯 Using first part of full_name:", firstNameFromFull);
         return firstNameFromFull;
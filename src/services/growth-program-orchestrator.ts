@@ -85,13 +85,15 @@ class GrowthProgramOrchestrator {
     const cacheKey = `${userId}-${domain}`;
     
     // Check cache first
-    if (this.contextCache.has(cacheKey)) {
-      return this.contextCache.get(cacheKey)!;
+    const cached = this.contextCache.get(cacheKey);
+    if (cached) {
+      return cached;
     }
 
     // Prevent duplicate loading
-    if (this.loadingStates.has(cacheKey)) {
-      return this.loadingStates.get(cacheKey)!;
+    const loading = this.loadingStates.get(cacheKey);
+    if (loading) {
+      return loading;
     }
 
     const loadingPromise = this.performEnhancedLoading(basicContext, blueprintData, domain);
@@ -238,7 +240,7 @@ class GrowthProgramOrchestrator {
     }
     
     return blueprintData.user_meta.preferred_name || 
-           blueprintData.user_meta.full_name?.split(' ')[0] || 
+           blueprintData.user_meta.full_name?.split(' ', 1)[0] || 
            'Friend';
   }
 
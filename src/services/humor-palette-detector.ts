@@ -1,6 +1,81 @@
 
 import { LayeredBlueprint, HumorStyle, HumorProfile } from '@/types/personality-modules';
 
+// MBTI-based humor mapping
+const MBTI_HUMOR_STYLES: Readonly<Record<string, HumorStyle>> = {
+  'ENTP': 'witty-inventor',
+  'ENFP': 'playful-storyteller', 
+  'INTP': 'dry-strategist',
+  'INFP': 'gentle-empath',
+  'ESTJ': 'observational-analyst',
+  'ESFJ': 'warm-nurturer',
+  'ENFJ': 'warm-nurturer',
+  'ENTJ': 'dry-strategist',
+  'ISFP': 'gentle-empath',
+  'ISTP': 'dry-strategist',
+  'ESTP': 'spontaneous-entertainer',
+  'ESFP': 'spontaneous-entertainer',
+  'ISFJ': 'warm-nurturer',
+  'ISTJ': 'observational-analyst',
+  'INFJ': 'philosophical-sage',
+  'INTJ': 'dry-strategist'
+};
+
+// Sun sign modifiers
+const FIRE_SIGNS: ReadonlySet<string> = new Set(['Aries', 'Leo', 'Sagittarius']);
+const AIR_SIGNS: ReadonlySet<string> = new Set(['Gemini', 'Libra', 'Aquarius']);
+const WATER_SIGNS: ReadonlySet<string> = new Set(['Cancer', 'Scorpio', 'Pisces']);
+const VIBRANT_SIGNS: ReadonlySet<string> = new Set(['Leo', 'Sagittarius', 'Aries', 'Gemini']);
+const SUBTLE_SIGNS: ReadonlySet<string> = new Set(['Cancer', 'Pisces', 'Scorpio', 'Virgo']);
+
+// Map auxiliary cognitive functions to secondary humor styles
+const AUX_HUMOR_STYLES: Readonly<Record<string, HumorStyle>> = {
+  'Ne': 'playful-storyteller',
+  'Ni': 'philosophical-sage',
+  'Se': 'spontaneous-entertainer',
+  'Si': 'warm-nurturer',
+  'Te': 'dry-strategist',
+  'Ti': 'witty-inventor',
+  'Fe': 'warm-nurturer',
+  'Fi': 'gentle-empath'
+};
+
+// Coaching contexts benefit from motivational humor
+const COACHING_HUMOR: Readonly<Record<HumorStyle, HumorStyle>> = {
+  'witty-inventor': 'observational-analyst',
+  'dry-strategist': 'observational-analyst',
+  'playful-storyteller': 'warm-nurturer',
+  'warm-nurturer': 'warm-nurturer',
+  'observational-analyst': 'observational-analyst',
+  'spontaneous-entertainer': 'warm-nurturer',
+  'philosophical-sage': 'gentle-empath',
+  'gentle-empath': 'gentle-empath'
+};
+
+// Guidance contexts benefit from wisdom-oriented humor
+const GUIDANCE_HUMOR: Readonly<Record<HumorStyle, HumorStyle>> = {
+  'witty-inventor': 'philosophical-sage',
+  'dry-strategist': 'philosophical-sage',
+  'playful-storyteller': 'gentle-empath',
+  'warm-nurturer': 'gentle-empath',
+  'observational-analyst': 'philosophical-sage',
+  'spontaneous-entertainer': 'playful-storyteller',
+  'philosophical-sage': 'philosophical-sage',
+  'gentle-empath': 'gentle-empath'
+};
+
+// Signature element lists are returned as shared references; treat them as read-only
+const SIGNATURE_ELEMENTS: Readonly<Record<HumorStyle, string[]>> = {
+  'witty-inventor': ['clever wordplay', 'unexpected connections', 'intellectual puns'],
+  'dry-strategist': ['subtle irony', 'deadpan delivery', 'understated observations'],
+  'playful-storyteller': ['vivid analogies', 'character voices', 'plot twists'],
+  'warm-nurturer': ['gentle teasing', 'inclusive humor', 'encouraging jokes'],
+  'observational-analyst': ['situational comedy', 'pattern recognition', 'logical absurdities'],
+  'spontaneous-entertainer': ['physical comedy', 'improv style', 'energy-based humor'],
+  'philosophical-sage': ['existential humor', 'profound one-liners', 'wisdom through paradox'],
+  'gentle-empath': ['self-deprecating humor', 'emotional intelligence', 'healing laughter']
+};
+
 export class HumorPaletteDetector {
   
   /**
@@ -36,46 +111,20 @@ export class HumorPaletteDetector {
     hdType: string, 
     dominantFunction: string
   ): HumorStyle {
-    // MBTI-based humor mapping
-    const mbtiHumorMap: Record<string, HumorStyle> = {
-      'ENTP': 'witty-inventor',
-      'ENFP': 'playful-storyteller', 
-      'INTP': 'dry-strategist',
-      'INFP': 'gentle-empath',
-      'ESTJ': 'observational-analyst',
-      'ESFJ': 'warm-nurturer',
-      'ENFJ': 'warm-nurturer',
-      'ENTJ': 'dry-strategist',
-      'ISFP': 'gentle-empath',
-      'ISTP': 'dry-strategist',
-      'ESTP': 'spontaneous-entertainer',
-      'ESFP': 'spontaneous-entertainer',
-      'ISFJ': 'warm-nurturer',
-      'ISTJ': 'observational-analyst',
-      'INFJ': 'philosophical-sage',
-      'INTJ': 'dry-strategist'
-    };
-
-    // Sun sign modifiers
-    const fireSignModifiers = ['Aries', 'Leo', 'Sagittarius'];
-    const airSignModifiers = ['Gemini', 'Libra', 'Aquarius'];
-    const earthSignModifiers = ['Taurus', 'Virgo', 'Capricorn'];
-    const waterSignModifiers = ['Cancer', 'Scorpio', 'Pisces'];
-
-    let baseStyle = mbtiHumorMap[mbtiType] || 'observational-analyst';
+    let baseStyle = MBTI_HUMOR_STYLES[mbtiType] || 'observational-analyst';
 
     // Astrological adjustments
-    if (fireSignModifiers.includes(sunSign)) {
+    if (FIRE_SIGNS.has(sunSign)) {
       if (baseStyle === 'gentle-empath') baseStyle = 'spontaneous-entertainer';
       if (baseStyle === 'observational-analyst') baseStyle = 'witty-inventor';
     }
     
-    if (airSignModifiers.includes(sunSign)) {
+    if (AIR_SIGNS.has(sunSign)) {
       if (baseStyle === 'warm-nurturer') baseStyle = 'witty-inventor';
       if (baseStyle === 'philosophical-sage') baseStyle = 'observational-analyst';
     }
 
-    if (waterSignModifiers.includes(sunSign)) {
+    if (WATER_SIGNS.has(sunSign)) {
       if (baseStyle === 'dry-strategist') baseStyle = 'philosophical-sage';
       if (baseStyle === 'witty-inventor') baseStyle = 'gentle-empath';
     }
@@ -94,19 +143,7 @@ export class HumorPaletteDetector {
   private static calculateSecondaryStyle(blueprint: Partial<LayeredBlueprint>): HumorStyle | undefined {
     const auxiliaryFunction = blueprint.cognitiveTemperamental?.auxiliaryFunction || '';
     
-    // Map auxiliary cognitive functions to secondary humor styles
-    const auxHumorMap: Record<string, HumorStyle> = {
-      'Ne': 'playful-storyteller',
-      'Ni': 'philosophical-sage',
-      'Se': 'spontaneous-entertainer',
-      'Si': 'warm-nurturer',
-      'Te': 'dry-strategist',
-      'Ti': 'witty-inventor',
-      'Fe': 'warm-nurturer',
-      'Fi': 'gentle-empath'
-    };
-
-    return auxHumorMap[auxiliaryFunction];
+    return AUX_HUMOR_STYLES[auxiliaryFunction];
   }
 
   private static calculateIntensity(blueprint: Partial<LayeredBlueprint>): 'subtle' | 'moderate' | 'vibrant' {
@@ -115,11 +152,11 @@ export class HumorPaletteDetector {
     
     // Extroverted types tend toward higher intensity
     if (mbtiType.startsWith('E')) {
-      return ['Leo', 'Sagittarius', 'Aries', 'Gemini'].includes(sunSign) ? 'vibrant' : 'moderate';
+      return VIBRANT_SIGNS.has(sunSign) ? 'vibrant' : 'moderate';
     }
     
     // Introverted types lean subtle to moderate
-    return ['Cancer', 'Pisces', 'Scorpio', 'Virgo'].includes(sunSign) ? 'subtle' : 'moderate';
+    return SUBTLE_SIGNS.has(sunSign) ? 'subtle' : 'moderate';
   }
 
   private static calculateAppropriatenessLevel(blueprint: Partial<LayeredBlueprint>): 'conservative' | 'balanced' | 'playful' {
@@ -148,32 +185,10 @@ export class HumorPaletteDetector {
 
   private static adaptHumorForContext(style: HumorStyle, context: 'coaching' | 'guidance'): HumorStyle {
     if (context === 'coaching') {
-      // Coaching contexts benefit from motivational humor
-      const coachingMap: Record<HumorStyle, HumorStyle> = {
-        'witty-inventor': 'observational-analyst',
-        'dry-strategist': 'observational-analyst',
-        'playful-storyteller': 'warm-nurturer',
-        'warm-nurturer': 'warm-nurturer',
-        'observational-analyst': 'observational-analyst',
-        'spontaneous-entertainer': 'warm-nurturer',
-        'philosophical-sage': 'gentle-empath',
-        'gentle-empath': 'gentle-empath'
-      };
-      return coachingMap[style];
+      return COACHING_HUMOR[style];
     }
     
-    // Guidance contexts benefit from wisdom-oriented humor
-    const guidanceMap: Record<HumorStyle, HumorStyle> = {
-      'witty-inventor': 'philosophical-sage',
-      'dry-strategist': 'philosophical-sage',
-      'playful-storyteller': 'gentle-empath',
-      'warm-nurturer': 'gentle-empath',
-      'observational-analyst': 'philosophical-sage',
-      'spontaneous-entertainer': 'playful-storyteller',
-      'philosophical-sage': 'philosophical-sage',
-      'gentle-empath': 'gentle-empath'
-    };
-    return guidanceMap[style];
+    return GUIDANCE_HUMOR[style];
   }
 
   private static generateAvoidancePatterns(blueprint: Partial<LayeredBlueprint>): string[] {
@@ -201,18 +216,7 @@ export class HumorPaletteDetector {
     mbtiType: string, 
     sunSign: string
   ): string[] {
-    const baseElements: Record<HumorStyle, string[]> = {
-      'witty-inventor': ['clever wordplay', 'unexpected connections', 'intellectual puns'],
-      'dry-strategist': ['subtle irony', 'deadpan delivery', 'understated observations'],
-      'playful-storyteller': ['vivid analogies', 'character voices', 'plot twists'],
-      'warm-nurturer': ['gentle teasing', 'inclusive humor', 'encouraging jokes'],
-      'observational-analyst': ['situational comedy', 'pattern recognition', 'logical absurdities'],
-      'spontaneous-entertainer': ['physical comedy', 'improv style', 'energy-based humor'],
-      'philosophical-sage': ['existential humor', 'profound one-liners', 'wisdom through paradox'],
-      'gentle-empath': ['self-deprecating humor', 'emotional intelligence', 'healing laughter']
-    };
-    
-    return baseElements[style] || baseElements['observational-analyst'];
+    return SIGNATURE_ELEMENTS[style] || SIGNATURE_ELEMENTS['observational-analyst'];
   }
 
   /**
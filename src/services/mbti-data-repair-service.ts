@@ -5,38 +5,24 @@
  */
 
 import { supabase } from '@/integrations/supabase/client';
+import { MBTI_FUNCTION_NAMES } from '@/utils/mbti-cognitive-functions';
 
 /**
- * The 16 types and their dominant/auxiliary functions. Module-level so that
- * validation and mapping cannot drift apart — a string is accepted as an MBTI
- * type only if this map can actually place it.
+ * The 16 types, in the order this module has always exported them. Their
+ * dominant/auxiliary functions come from the shared MBTI_FUNCTION_NAMES
+ * table, so validation and mapping cannot drift apart — a string is accepted
+ * as an MBTI type only if that table can actually place it.
  */
-const MBTI_FUNCTIONS: Record<string, { dominant: string; auxiliary: string }> = {
-  INFP: { dominant: 'Introverted Feeling', auxiliary: 'Extraverted Intuition' },
-  ENFP: { dominant: 'Extraverted Intuition', auxiliary: 'Introverted Feeling' },
-  INFJ: { dominant: 'Introverted Intuition', auxiliary: 'Extraverted Feeling' },
-  ENFJ: { dominant: 'Extraverted Feeling', auxiliary: 'Introverted Intuition' },
-  INTJ: { dominant: 'Introverted Intuition', auxiliary: 'Extraverted Thinking' },
-  ENTJ: { dominant: 'Extraverted Thinking', auxiliary: 'Introverted Intuition' },
-  INTP: { dominant: 'Introverted Thinking', auxiliary: 'Extraverted Intuition' },
-  ENTP: { dominant: 'Extraverted Intuition', auxiliary: 'Introverted Thinking' },
-  ISFP: { dominant: 'Introverted Feeling', auxiliary: 'Extraverted Sensing' },
-  ESFP: { dominant: 'Extraverted Sensing', auxiliary: 'Introverted Feeling' },
-  ISFJ: { dominant: 'Introverted Sensing', auxiliary: 'Extraverted Feeling' },
-  ESFJ: { dominant: 'Extraverted Feeling', auxiliary: 'Introverted Sensing' },
-  ISTJ: { dominant: 'Introverted Sensing', auxiliary: 'Extraverted Thinking' },
-  ESTJ: { dominant: 'Extraverted Thinking', auxiliary: 'Introverted Sensing' },
-  ISTP: { dominant: 'Introverted Thinking', auxiliary: 'Extraverted Sensing' },
-  ESTP: { dominant: 'Extraverted Sensing', auxiliary: 'Introverted Thinking' },
-};
-
-export const MBTI_TYPES = Object.keys(MBTI_FUNCTIONS);
+export const MBTI_TYPES = [
+  'INFP', 'ENFP', 'INFJ', 'ENFJ', 'INTJ', 'ENTJ', 'INTP', 'ENTP',
+  'ISFP', 'ESFP', 'ISFJ', 'ESFJ', 'ISTJ', 'ESTJ', 'ISTP', 'ESTP',
+];
 
 /** Only a real, placeable type counts. Anything else is Unknown, never guessed. */
 function asMbtiType(value: unknown): string | null {
   if (typeof value !== 'string') return null;
   const upper = value.trim().toUpperCase();
-  return MBTI_FUNCTIONS[upper] ? upper : null;
+  return MBTI_FUNCTION_NAMES[upper] ? upper : null;
 }
 
 export interface MBTIRepairResult {
@@ -197,7 +183,7 @@ class MBTIDataRepairService {
   private buildMBTIStructure(personalityData: { mbtiType: string; description?: string; confidence?: number; bigFive?: any }) {
     const { mbtiType, description = '', confidence = 0.8, bigFive = {} } = personalityData;
     
-    const functions = MBTI_FUNCTIONS[mbtiType] || { dominant: 'Unknown', auxiliary: 'Unknown' };
+    const functions = MBTI_FUNCTION_NAMES[mbtiType] || { dominant: 'Unknown', auxiliary: 'Unknown' };
     
     // Extract keywords from description
     const extractKeywords = (desc: string) => {
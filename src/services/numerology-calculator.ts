@@ -15,66 +15,33 @@ export interface NumerologyResult {
 }
 
 export class NumerologyCalculator {
-  // Traditional Pythagorean numerology letter values
-  private static letterValues: Record<string, number> = {
-    'A': 1, 'B': 2, 'C': 3, 'D': 4, 'E': 5, 'F': 6, 'G': 7, 'H': 8, 'I': 9,
-    'J': 1, 'K': 2, 'L': 3, 'M': 4, 'N': 5, 'O': 6, 'P': 7, 'Q': 8, 'R': 9,
-    'S': 1, 'T': 2, 'U': 3, 'V': 4, 'W': 5, 'X': 6, 'Y': 7, 'Z': 8
-  };
-
-  private static vowels = ['A', 'E', 'I', 'O', 'U', 'Y']; // Include Y as vowel
+  // Traditional Pythagorean numerology letter values, indexed by A-Z position:
+  // A-I = 1-9, J-R = 1-9, S-Z = 1-8
+  private static readonly LETTER_VALUES: Uint8Array = Uint8Array.from({ length: 26 }, (_, i) => (i % 9) + 1);
 
-  // Utility for name-by-name reduction (standard numerology)
-  private static reduceNameParts(
-    fullName: string,
-    filterFn: (letter: string) => boolean
-  ): number {
-    console.log('🔢 NUMEROLOGY: reduceNameParts input:', { fullName, filterFn: filterFn.toString() });
-    
-    // Split into parts (first/middle/last)
-    const nameParts = fullName.toUpperCase().split(/\s+/).filter(Boolean);
-    console.log('🔢 NUMEROLOGY: nameParts:', nameParts);
-    
-    const reducedParts: number[] = [];
+  // Classic vowels for soul urge / personality as bits of the A-Z position
+  // (Y is treated as a consonant)
+  private static readonly VOWEL_MASK = (1 << 0) | (1 << 4) | (1 << 8) | (1 << 14) | (1 << 20);
 
-    for (const part of nameParts) {
-      // Get only relevant letters in this part
-      const letters = part.replace(/[^A-Z]/g, '').split('').filter(filterFn);
-      console.log('🔢 NUMEROLOGY: filtered letters for part', part, ':', letters);
-      
-      // Sum their values
-      const sum = letters.reduce(
-        (acc, ch) => acc + (this.letterValues[ch] || 0),
-        0
-      );
-      console.log('🔢 NUMEROLOGY: sum for part', part, ':', sum);
-      
-      // Reduce sum to 1 digit or master number
-      const reduced = this.reduceToSingleDigitWithMasters(sum);
-      console.log('🔢 NUMEROLOGY: reduced for part', part, ':', reduced);
-      reducedParts.push(reduced);
+  // Step-by-step tracing is only wanted while developing; production builds
+  // skip the console work on every reduction step.
+  private static debug(...args: unknown[]): void {
+    if (import.meta.env.DEV) {
+      console.log(...args);
     }
-    
-    // Now sum the reduced values of all parts
-    const total = reducedParts.reduce((a, b) => a + b, 0);
-    console.log('🔢 NUMEROLOGY: total before final reduction:', total);
-    
-    const finalResult = this.reduceToSingleDigitWithMasters(total);
-    console.log('🔢 NUMEROLOGY: final result:', finalResult);
-    
-    return finalResult;
+  }
+
+  private static isVowel(letterIndex: number): boolean {
+    return ((this.VOWEL_MASK >>> letterIndex) & 1) === 1;
   }
 
   static calculateNumerology(fullName: string, birthDate: string): NumerologyResult {
-    console.log('🔢 NUMEROLOGY: Starting calculation with inputs:', { fullName, birthDate });
+    this.debug('🔢 NUMEROLOGY: Starting calculation with inputs:', { fullName, birthDate });
     
-    const lifePathNumber = this.calculateLifePath(birthDate);
-    const expressionNumber = this.calculateExpression(fullName);
-    const soulUrgeNumber = this.calculateSoulUrge(fullName);
-    const personalityNumber = this.calculatePersonality(fullName);
-    const birthdayNumber = this.calculateBirthday(birthDate);
+    const { lifePathNumber, birthdayNumber } = this.getDateNumbers(birthDate);
+    const { expressionNumber, soulUrgeNumber, personalityNumber } = this.getNameNumbers(fullName);
 
-    console.log('🔢 NUMEROLOGY: Raw calculation results:', {
+    this.debug('🔢 NUMEROLOGY: Raw calculation results:', {
       lifePathNumber,
       expressionNumber,
       soulUrgeNumber,
@@ -95,17 +62,66 @@ export class NumerologyCalculator {
       birthdayKeyword: this.getBirthdayKeyword(birthdayNumber)
     };
 
-    console.log('🔢 NUMEROLOGY RESULTS:', result);
+    this.debug('🔢 NUMEROLOGY RESULTS:', result);
     return result;
   }
 
-  private static calculateLifePath(birthDate: string): number {
-    console.log('🔢 Life Path calculation for:', birthDate);
-    
+  // Life path and birthday numbers depend only on the birth date, and the same
+  // dates recur across recalculations, so reduce each date once
+  private static readonly DATE_CACHE_LIMIT = 1024;
+  private static dateNumbersCache = new Map<string, { lifePathNumber: number; birthdayNumber: number }>();
+
+  private static getDateNumbers(birthDate: string): { lifePathNumber: number; birthdayNumber: number } {
+    const cached = this.dateNumbersCache.get(birthDate);
+    if (cached) {
+      return cached;
+    }
+
+    if (this.dateNumbersCache.size >= this.DATE_CACHE_LIMIT) {
+      // Maps iterate in insertion order, so the first key is the oldest entry
+      this.dateNumbersCache.delete(this.dateNumbersCache.keys().next().value!);
+    }
+
+    // Both numbers read the same fields, so parse the date once for the pair
+    const date = this.parseBirthDate(birthDate);
+    const dateNumbers = {
+      lifePathNumber: this.calculateLifePath(date),
+      birthdayNumber: this.calculateBirthday(date.day)
+    };
+    this.dateNumbersCache.set(birthDate, dateNumbers);
+    return dateNumbers;
+  }
+
+  // Names repeat across regenerations for the same user, so score each once
+  private static readonly NAME_CACHE_LIMIT = 1024;
+  private static nameNumbersCache = new Map<string, { expressionNumber: number; soulUrgeNumber: number; personalityNumber: number }>();
+
+  private static getNameNumbers(fullName: string): { expressionNumber: number; soulUrgeNumber: number; personalityNumber: number } {
+    const cached = this.nameNumbersCache.get(fullName);
+    if (cached) {
+      return cached;
+    }
+
+    if (this.nameNumbersCache.size >= this.NAME_CACHE_LIMIT) {
+      // Maps iterate in insertion order, so the first key is the oldest entry
+      this.nameNumbersCache.delete(this.nameNumbersCache.keys().next().value!);
+    }
+
+    const nameNumbers = this.calculateNameNumbers(fullName);
+    this.nameNumbersCache.set(fullName, nameNumbers);
+    return nameNumbers;
+  }
+
+  private static parseBirthDate(birthDate: string): { year: number; month: number; day: number } {
     // Handle different date formats
     let year: number, month: number, day: number;
     
-    if (birthDate.includes('-')) {
+    if (birthDate.length === 10 && birthDate[4] === '-' && birthDate[7] === '-') {
+      // Fixed-width YYYY-MM-DD, the stored format: read the fields by position
+      year = Number(birthDate.slice(0, 4));
+      month = Number(birthDate.slice(5, 7));
+      day = Number(birthDate.slice(8, 10));
+    } else if (birthDate.includes('-')) {
       const [yearStr, monthStr, dayStr] = birthDate.split('-');
       year = parseInt(yearStr, 10);
       month = parseInt(monthStr, 10);
@@ -118,139 +134,163 @@ export class NumerologyCalculator {
       day = date.getDate();
     }
     
-    console.log('🔢 Parsed date:', { year, month, day });
-    
+    this.debug('🔢 Parsed date:', { birthDate, year, month, day });
+    return { year, month, day };
+  }
+
+  private static calculateLifePath({ year, month, day }: { year: number; month: number; day: number }): number {
     // Traditional method: reduce each component separately first, then add
     const reducedMonth = this.reduceToSingleDigitWithMasters(month);
     const reducedDay = this.reduceToSingleDigitWithMasters(day);
     const reducedYear = this.reduceToSingleDigitWithMasters(year);
     
-    console.log('🔢 Reduced components:', { reducedMonth, reducedDay, reducedYear });
+    this.debug('🔢 Reduced components:', { reducedMonth, reducedDay, reducedYear });
     
     // Add the reduced components
     const total = reducedMonth + reducedDay + reducedYear;
-    console.log('🔢 Total before final reduction:', total);
+    this.debug('🔢 Total before final reduction:', total);
     
     const result = this.reduceToSingleDigitWithMasters(total);
-    console.log('🔢 Life Path result:', result);
+    this.debug('🔢 Life Path result:', result);
     
     return result;
   }
 
-  // --- UPDATED TO STANDARD NAME-BY-NAME REDUCTION ---
-  private static calculateExpression(fullName: string): number {
-    console.log('🔢 Expression calculation for:', fullName);
-    // expression uses ALL letters
-    return this.reduceNameParts(fullName, (ch) => /[A-Z]/.test(ch));
-  }
+  // --- STANDARD NAME-BY-NAME REDUCTION ---
+  // Expression uses ALL letters, soul urge ONLY vowels and personality ONLY
+  // consonants. Each name part (first/middle/last) is reduced on its own before
+  // the parts are added, and all three numbers are scored in one pass.
+  private static calculateNameNumbers(fullName: string): { expressionNumber: number; soulUrgeNumber: number; personalityNumber: number } {
+    this.debug('🔢 NUMEROLOGY: name numbers input:', fullName);
 
-  private static calculateSoulUrge(fullName: string): number {
-    console.log('🔢 Soul Urge calculation for:', fullName);
-    // soul urge: ONLY vowels (A E I O U, maybe Y, but we skip Y for classic mode)
-    return this.reduceNameParts(fullName, (ch) => ['A', 'E', 'I', 'O', 'U'].includes(ch));
-  }
+    const nameParts = fullName.toUpperCase().split(/\s+/).filter(Boolean);
+    this.debug('🔢 NUMEROLOGY: nameParts:', nameParts);
 
-  private static calculatePersonality(fullName: string): number {
-    console.log('🔢 Personality calculation for:', fullName);
-    // personality: ONLY consonants (all A-Z minus vowels)
-    return this.reduceNameParts(fullName, (ch) => /[A-Z]/.test(ch) && !['A', 'E', 'I', 'O', 'U'].includes(ch));
-  }
+    let expressionTotal = 0;
+    let soulUrgeTotal = 0;
+    let personalityTotal = 0;
 
-  private static calculateBirthday(birthDate: string): number {
-    console.log('🔢 Birthday calculation for:', birthDate);
-    
-    let day: number;
-    
-    if (birthDate.includes('-')) {
-      const parts = birthDate.split('-');
-      day = parseInt(parts[2], 10);
-    } else {
-      const date = new Date(birthDate);
-      day = date.getDate();
+    for (const part of nameParts) {
+      // Letters are addressed by their A-Z position; anything else is skipped
+      let vowelSum = 0;
+      let consonantSum = 0;
+      for (let i = 0; i < part.length; i++) {
+        const letterIndex = part.charCodeAt(i) - 65;
+        if (letterIndex < 0 || letterIndex >= 26) continue;
+
+        if (this.isVowel(letterIndex)) {
+          vowelSum += this.LETTER_VALUES[letterIndex];
+        } else {
+          consonantSum += this.LETTER_VALUES[letterIndex];
+        }
+      }
+      this.debug('🔢 NUMEROLOGY: vowel/consonant sums for part', part, ':', vowelSum, consonantSum);
+
+      // Reduce each part's sums to 1 digit or master number
+      expressionTotal += this.reduceToSingleDigitWithMasters(vowelSum + consonantSum);
+      soulUrgeTotal += this.reduceToSingleDigitWithMasters(vowelSum);
+      personalityTotal += this.reduceToSingleDigitWithMasters(consonantSum);
     }
-    
-    console.log('🔢 Birthday calculation for day:', day);
+
+    // Now reduce the totals of the reduced parts
+    const nameNumbers = {
+      expressionNumber: this.reduceToSingleDigitWithMasters(expressionTotal),
+      soulUrgeNumber: this.reduceToSingleDigitWithMasters(soulUrgeTotal),
+      personalityNumber: this.reduceToSingleDigitWithMasters(personalityTotal)
+    };
+    this.debug('🔢 NUMEROLOGY: name numbers:', nameNumbers);
+
+    return nameNumbers;
+  }
+
+  private static calculateBirthday(day: number): number {
+    this.debug('🔢 Birthday calculation for day:', day);
     
     const result = this.reduceToSingleDigitWithMasters(day);
-    console.log('🔢 Birthday result:', result);
+    this.debug('🔢 Birthday result:', result);
     
     return result;
   }
 
   private static addDigits(num: number): number {
-    return num.toString().split('').reduce((sum, digit) => sum + parseInt(digit), 0);
+    // Integer digit sum; avoids a string round-trip per reduction step
+    let sum = 0;
+    for (let rest = num; rest > 0; rest = Math.floor(rest / 10)) {
+      sum += rest % 10;
+    }
+    return sum;
   }
 
   private static reduceToSingleDigitWithMasters(num: number): number {
-    console.log('🔢 Reducing:', num);
+    this.debug('🔢 Reducing:', num);
     
     while (num > 9) {
       // Check if current number is a master number before reducing
       if (num === 11 || num === 22 || num === 33) {
-        console.log('🔢 Master number found:', num);
+        this.debug('🔢 Master number found:', num);
         return num;
       }
       
       // Reduce by adding digits
       num = this.addDigits(num);
-      console.log('🔢 After digit addition:', num);
+      this.debug('🔢 After digit addition:', num);
       
       // Check again if the result is a master number
       if (num === 11 || num === 22 || num === 33) {
-        console.log('🔢 Master number found after reduction:', num);
+        this.debug('🔢 Master number found after reduction:', num);
         return num;
       }
     }
     
-    console.log('🔢 Final reduced number:', num);
+    this.debug('🔢 Final reduced number:', num);
     return num;
   }
 
+  private static readonly LIFE_PATH_KEYWORDS: Readonly<Record<number, string>> = {
+    1: 'Independent Leader', 2: 'Cooperative Diplomat', 3: 'Creative Communicator', 
+    4: 'Practical Builder', 5: 'Freedom Seeker', 6: 'Nurturing Caregiver',
+    7: 'Spiritual Seeker', 8: 'Material Achiever', 9: 'Universal Humanitarian',
+    11: 'Illuminating Visionary', 22: 'Master Builder', 33: 'Master Teacher'
+  };
+
+  private static readonly EXPRESSION_KEYWORDS: Readonly<Record<number, string>> = {
+    1: 'Pioneering Leader', 2: 'Diplomatic Peacemaker', 3: 'Creative Communicator', 
+    4: 'Practical Organizer', 5: 'Dynamic Adventurer', 6: 'Compassionate Helper',
+    7: 'Analytical Thinker', 8: 'Executive Achiever', 9: 'Humanitarian Visionary',
+    11: 'Inspirational Visionary (Master)', 22: 'Master Manifestor', 33: 'Universal Healer'
+  };
+
+  private static readonly SOUL_URGE_KEYWORDS: Readonly<Record<number, string>> = {
+    1: 'Independent Pioneer', 2: 'Harmonious Peacemaker', 3: 'Creative Self-Expression', 
+    4: 'Stable Security', 5: 'Adventure Freedom', 6: 'Nurturing Service',
+    7: 'Spiritual Understanding', 8: 'Ambitious Manifestor', 9: 'Universal Love',
+    11: 'Spiritual Insight', 22: 'Global Vision', 33: 'Universal Compassion'
+  };
+
+  // Personality and birthday numbers share the same trait keywords
+  private static readonly TRAIT_KEYWORDS: Readonly<Record<number, string>> = {
+    1: 'Original', 2: 'Sensitive', 3: 'Expressive', 4: 'Practical', 5: 'Versatile',
+    6: 'Responsible', 7: 'Analytical', 8: 'Executive', 9: 'Generous',
+    11: 'Intuitive', 22: 'Master Builder', 33: 'Master Teacher'
+  };
+
   private static getLifePathKeyword(number: number): string {
-    const keywords: Record<number, string> = {
-      1: 'Independent Leader', 2: 'Cooperative Diplomat', 3: 'Creative Communicator', 
-      4: 'Practical Builder', 5: 'Freedom Seeker', 6: 'Nurturing Caregiver',
-      7: 'Spiritual Seeker', 8: 'Material Achiever', 9: 'Universal Humanitarian',
-      11: 'Illuminating Visionary', 22: 'Master Builder', 33: 'Master Teacher'
-    };
-    return keywords[number] || 'Seeker';
+    return this.LIFE_PATH_KEYWORDS[number] || 'Seeker';
   }
 
   private static getExpressionKeyword(number: number): string {
-    const keywords: Record<number, string> = {
-      1: 'Pioneering Leader', 2: 'Diplomatic Peacemaker', 3: 'Creative Communicator', 
-      4: 'Practical Organizer', 5: 'Dynamic Adventurer', 6: 'Compassionate Helper',
-      7: 'Analytical Thinker', 8: 'Executive Achiever', 9: 'Humanitarian Visionary',
-      11: 'Inspirational Visionary (Master)', 22: 'Master Manifestor', 33: 'Universal Healer'
-    };
-    return keywords[number] || 'Seeker';
+    return this.EXPRESSION_KEYWORDS[number] || 'Seeker';
   }
 
   private static getSoulUrgeKeyword(number: number): string {
-    const keywords: Record<number, string> = {
-      1: 'Independent Pioneer', 2: 'Harmonious Peacemaker', 3: 'Creative Self-Expression', 
-      4: 'Stable Security', 5: 'Adventure Freedom', 6: 'Nurturing Service',
-      7: 'Spiritual Understanding', 8: 'Ambitious Manifestor', 9: 'Universal Love',
-      11: 'Spiritual Insight', 22: 'Global Vision', 33: 'Universal Compassion'
-    };
-    return keywords[number] || 'Understanding';
+    return this.SOUL_URGE_KEYWORDS[number] || 'Understanding';
   }
 
   private static getPersonalityKeyword(number: number): string {
-    const keywords: Record<number, string> = {
-      1: 'Original', 2: 'Sensitive', 3: 'Expressive', 4: 'Practical', 5: 'Versatile',
-      6: 'Responsible', 7: 'Analytical', 8: 'Executive', 9: 'Generous',
-      11: 'Intuitive', 22: 'Master Builder', 33: 'Master Teacher'
-    };
-    return keywords[number] || 'Unique';
+    return this.TRAIT_KEYWORDS[number] || 'Unique';
   }
 
   private static getBirthdayKeyword(number: number): string {
-    const keywords: Record<number, string> = {
-      1: 'Original', 2: 'Sensitive', 3: 'Expressive', 4: 'Practical', 5: 'Versatile',
-      6: 'Responsible', 7: 'Analytical', 8: 'Executive', 9: 'Generous',
-      11: 'Intuitive', 22: 'Master Builder', 33: 'Master Teacher'
-    };
-    return keywords[number] || 'Unique';
+    return this.TRAIT_KEYWORDS[number] || 'Unique';
   }
 }
@@ -49,7 +49,7 @@ export class PersonalityEngine {
     }
     
     if (fullName && typeof fullName === 'string' && fullName.trim()) {
-      const firstName = fullName.trim().split(' ')[0];
+      const firstName = fullName.trim().split(' ', 1)[0];
       if (firstName) {
         return firstName;
       }
@@ -49,28 +49,30 @@ class PersonalityFusionService {
   };
 
   // MBTI → 16-dimensional latent vector encoder
-  private encodeMBTI(mbtiType: string): number[] {
-    // Deterministic mapping of 16 MBTI types to 16-dimensional vectors
-    const mbtiMap: Record<string, number[]> = {
-      'INTJ': [0.9, 0.8, -0.7, 0.6, -0.5, 0.8, -0.9, 0.7, 0.6, -0.4, 0.8, -0.6, 0.9, -0.7, 0.5, 0.8],
-      'INTP': [0.8, 0.9, -0.6, 0.7, -0.4, 0.9, -0.8, 0.6, 0.7, -0.3, 0.9, -0.5, 0.8, -0.6, 0.4, 0.7],
-      'ENTJ': [0.7, 0.6, 0.8, 0.9, 0.5, 0.7, 0.8, -0.6, 0.9, 0.4, 0.6, 0.7, -0.5, 0.8, 0.9, -0.4],
-      'ENTP': [0.6, 0.7, 0.9, 0.8, 0.4, 0.6, 0.9, -0.5, 0.8, 0.3, 0.7, 0.6, -0.4, 0.9, 0.8, -0.3],
-      'INFJ': [0.9, -0.6, 0.7, -0.8, 0.5, -0.7, 0.8, 0.9, -0.4, 0.6, -0.5, 0.7, 0.8, -0.6, 0.9, 0.4],
-      'INFP': [0.8, -0.5, 0.6, -0.7, 0.4, -0.6, 0.7, 0.8, -0.3, 0.5, -0.4, 0.6, 0.7, -0.5, 0.8, 0.3],
-      'ENFJ': [-0.6, 0.8, -0.7, 0.9, -0.5, 0.7, -0.8, 0.6, 0.9, -0.4, 0.8, -0.6, 0.7, 0.9, -0.5, 0.8],
-      'ENFP': [-0.5, 0.7, -0.6, 0.8, -0.4, 0.6, -0.7, 0.5, 0.8, -0.3, 0.7, -0.5, 0.6, 0.8, -0.4, 0.7],
-      'ISTJ': [-0.8, -0.9, 0.6, -0.7, 0.8, -0.6, 0.9, -0.8, 0.7, 0.9, -0.5, 0.6, -0.7, 0.8, -0.9, 0.5],
-      'ISFJ': [-0.7, -0.8, 0.5, -0.6, 0.7, -0.5, 0.8, -0.7, 0.6, 0.8, -0.4, 0.5, -0.6, 0.7, -0.8, 0.4],
-      'ESTJ': [0.6, -0.7, -0.8, 0.9, -0.6, 0.8, -0.7, 0.5, -0.9, 0.7, 0.8, -0.5, 0.6, -0.8, 0.9, -0.6],
-      'ESFJ': [0.5, -0.6, -0.7, 0.8, -0.5, 0.7, -0.6, 0.4, -0.8, 0.6, 0.7, -0.4, 0.5, -0.7, 0.8, -0.5],
-      'ISTP': [-0.9, 0.6, -0.5, 0.7, -0.8, 0.5, -0.6, 0.9, 0.4, -0.7, 0.8, 0.6, -0.9, 0.5, 0.7, -0.8],
-      'ISFP': [-0.8, 0.5, -0.4, 0.6, -0.7, 0.4, -0.5, 0.8, 0.3, -0.6, 0.7, 0.5, -0.8, 0.4, 0.6, -0.7],
-      'ESTP': [0.4, 0.9, 0.6, -0.8, 0.7, -0.9, 0.5, -0.6, 0.8, 0.9, -0.7, 0.4, 0.6, -0.5, 0.8, 0.9],
-      'ESFP': [0.3, 0.8, 0.5, -0.7, 0.6, -0.8, 0.4, -0.5, 0.7, 0.8, -0.6, 0.3, 0.5, -0.4, 0.7, 0.8]
-    };
+  // Deterministic mapping of 16 MBTI types to 16-dimensional vectors; built once
+  // rather than on every encode, and copied out so callers can't alter the rows
+  private static readonly MBTI_VECTORS: Readonly<Record<string, readonly number[]>> = {
+    'INTJ': [0.9, 0.8, -0.7, 0.6, -0.5, 0.8, -0.9, 0.7, 0.6, -0.4, 0.8, -0.6, 0.9, -0.7, 0.5, 0.8],
+    'INTP': [0.8, 0.9, -0.6, 0.7, -0.4, 0.9, -0.8, 0.6, 0.7, -0.3, 0.9, -0.5, 0.8, -0.6, 0.4, 0.7],
+    'ENTJ': [0.7, 0.6, 0.8, 0.9, 0.5, 0.7, 0.8, -0.6, 0.9, 0.4, 0.6, 0.7, -0.5, 0.8, 0.9, -0.4],
+    'ENTP': [0.6, 0.7, 0.9, 0.8, 0.4, 0.6, 0.9, -0.5, 0.8, 0.3, 0.7, 0.6, -0.4, 0.9, 0.8, -0.3],
+    'INFJ': [0.9, -0.6, 0.7, -0.8, 0.5, -0.7, 0.8, 0.9, -0.4, 0.6, -0.5, 0.7, 0.8, -0.6, 0.9, 0.4],
+    'INFP': [0.8, -0.5, 0.6, -0.7, 0.4, -0.6, 0.7, 0.8, -0.3, 0.5, -0.4, 0.6, 0.7, -0.5, 0.8, 0.3],
+    'ENFJ': [-0.6, 0.8, -0.7, 0.9, -0.5, 0.7, -0.8, 0.6, 0.9, -0.4, 0.8, -0.6, 0.7, 0.9, -0.5, 0.8],
+    'ENFP': [-0.5, 0.7, -0.6, 0.8, -0.4, 0.6, -0.7, 0.5, 0.8, -0.3, 0.7, -0.5, 0.6, 0.8, -0.4, 0.7],
+    'ISTJ': [-0.8, -0.9, 0.6, -0.7, 0.8, -0.6, 0.9, -0.8, 0.7, 0.9, -0.5, 0.6, -0.7, 0.8, -0.9, 0.5],
+    'ISFJ': [-0.7, -0.8, 0.5, -0.6, 0.7, -0.5, 0.8, -0.7, 0.6, 0.8, -0.4, 0.5, -0.6, 0.7, -0.8, 0.4],
+    'ESTJ': [0.6, -0.7, -0.8, 0.9, -0.6, 0.8, -0.7, 0.5, -0.9, 0.7, 0.8, -0.5, 0.6, -0.8, 0.9, -0.6],
+    'ESFJ': [0.5, -0.6, -0.7, 0.8, -0.5, 0.7, -0.6, 0.4, -0.8, 0.6, 0.7, -0.4, 0.5, -0.7, 0.8, -0.5],
+    'ISTP': [-0.9, 0.6, -0.5, 0.7, -0.8, 0.5, -0.6, 0.9, 0.4, -0.7, 0.8, 0.6, -0.9, 0.5, 0.7, -0.8],
+    'ISFP': [-0.8, 0.5, -0.4, 0.6, -0.7, 0.4, -0.5, 0.8, 0.3, -0.6, 0.7, 0.5, -0.8, 0.4, 0.6, -0.7],
+    'ESTP': [0.4, 0.9, 0.6, -0.8, 0.7, -0.9, 0.5, -0.6, 0.8, 0.9, -0.7, 0.4, 0.6, -0.5, 0.8, 0.9],
+    'ESFP': [0.3, 0.8, 0.5, -0.7, 0.6, -0.8, 0.4, -0.5, 0.7, 0.8, -0.6, 0.3, 0.5, -0.4, 0.7, 0.8]
+  };
 
-    return mbtiMap[mbtiType] || new Array(16).fill(0);
+  private encodeMBTI(mbtiType: string): number[] {
+    const vector = PersonalityFusionService.MBTI_VECTORS[mbtiType];
+    return vector ? [...vector] : new Array(16).fill(0);
   }
 
   // Human Design → 64-channel binary vector encoder
@@ -246,7 +246,7 @@ export class RichIntelligenceBridge {
     
     return {
       userName: (blueprint as any).user_meta?.preferred_name || 
-                (blueprint as any).user_meta?.full_name?.split(' ')[0] || 
+                (blueprint as any).user_meta?.full_name?.split(' ', 1)[0] || 
                 (language === 'nl' ? 'vriend' : 'friend'),
       mbtiType,
       humanDesignType,
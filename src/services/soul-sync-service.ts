@@ -1,5 +1,6 @@
 import { supabase } from "@/integrations/supabase/client";
 import { LayeredBlueprint, VoiceToken } from "@/types/personality-modules";
+import { HD_STRATEGIES } from "@/services/blueprint-personality-filter";
 
 const TEMPLATE_VERSION = "1.1.0";
 
@@ -189,7 +190,7 @@ class SoulSyncService {
 
   private generatePersonalizedPrompt(blueprint: LayeredBlueprint, mode: "coach" | "guide" | "blend"): string {
     const userName = blueprint.user_meta?.preferred_name || 
-                     blueprint.user_meta?.full_name?.split(' ')[0] || 
+                     blueprint.user_meta?.full_name?.split(' ', 1)[0] || 
                      'friend';
 
     console.log(`🎯 SoulSync: Generating CONVERSATIONAL AI prompt for ${userName} (${mode}) - MUST use name!`);
@@ -571,13 +572,7 @@ You're ${userName}'s versatile companion who adapts to what they need most. Whet
   }
 
   private getHumanDesignStrategy(type: string): string {
-    const strategies = {
-      'Generator': 'respond to what lights you up and follow your gut',
-      'Projector': 'wait for invitation and recognition before sharing your gifts',
-      'Manifestor': 'initiate when you feel the urge, but inform others of your actions',
-      'Reflector': 'wait a full lunar cycle before making major decisions'
-    };
-    return strategies[type as keyof typeof strategies] || 'follow your natural energy flow';
+    return HD_STRATEGIES[type as keyof typeof HD_STRATEGIES] || 'follow your natural energy flow';
   }
 
   private getLifePathKeyword(path: number): string {
@@ -207,7 +207,7 @@ class UnifiedBrainContext {
 
   private extractUserName(userMeta: any): string {
     return userMeta?.preferred_name || userMeta?.first_name || 
-           userMeta?.full_name?.split(' ')[0] || 'friend';
+           userMeta?.full_name?.split(' ', 1)[0] || 'friend';
   }
 
   private extractUserPreferences(vector: Float32Array, userMeta: any): VPGBlueprint['user']['preferences'] {
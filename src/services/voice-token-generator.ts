@@ -1,6 +1,15 @@
 
 import { LayeredBlueprint, VoiceTokens } from '@/types/personality-modules';
 
+// MBTI groups that shape voice tokens, as sets so each check is one lookup
+const TJ_TYPES: ReadonlySet<string> = new Set(['ISTJ', 'ESTJ', 'INTJ', 'ENTJ']);
+const FP_TYPES: ReadonlySet<string> = new Set(['ISFP', 'ESFP', 'INFP', 'ENFP']);
+const NT_TYPES: ReadonlySet<string> = new Set(['INTJ', 'ENTJ', 'INTP', 'ENTP']);
+const NF_TYPES: ReadonlySet<string> = new Set(['INFJ', 'ENFJ', 'INFP', 'ENFP']);
+const ST_TYPES: ReadonlySet<string> = new Set(['ISTP', 'ESTP', 'ISTJ', 'ESTJ']);
+const DIRECT_TRANSITION_TYPES: ReadonlySet<string> = new Set(['INTJ', 'ENTJ', 'ISTP', 'ESTP']);
+const CONNECTIVE_TRANSITION_TYPES: ReadonlySet<string> = new Set(['INFP', 'ENFP', 'ISFJ', 'ESFJ']);
+
 export class VoiceTokenGenerator {
   static generateVoiceTokens(blueprint: Partial<LayeredBlueprint>): VoiceTokens {
     try {
@@ -37,7 +46,7 @@ export class VoiceTokenGenerator {
     try {
       const userMeta = blueprint.user_meta;
       return userMeta?.preferred_name || 
-             userMeta?.full_name?.split(' ')[0] || 
+             userMeta?.full_name?.split(' ', 1)[0] || 
              'friend';
     } catch (error) {
       return 'friend';
@@ -52,10 +61,10 @@ export class VoiceTokenGenerator {
     let pauseFrequency: 'minimal' | 'thoughtful' | 'dramatic' = 'thoughtful';
     let rhythmPattern: 'steady' | 'varied' | 'staccato' | 'melodic' = 'steady';
 
-    if (mbtiType && ['ISTJ', 'ESTJ', 'INTJ', 'ENTJ'].includes(mbtiType)) {
+    if (mbtiType && TJ_TYPES.has(mbtiType)) {
       sentenceLength = 'short';
       pauseFrequency = 'minimal';
-    } else if (mbtiType && ['ISFP', 'ESFP', 'INFP', 'ENFP'].includes(mbtiType)) {
+    } else if (mbtiType && FP_TYPES.has(mbtiType)) {
       sentenceLength = 'flowing';
       pauseFrequency = 'thoughtful';
     }
@@ -116,10 +125,10 @@ export class VoiceTokenGenerator {
     let metaphorUsage: 'literal' | 'occasional' | 'frequent' | 'poetic' = 'occasional';
     let technicalDepth: 'simplified' | 'balanced' | 'detailed' | 'expert' = 'balanced';
 
-    if (mbtiType && ['INTJ', 'ENTJ', 'INTP', 'ENTP'].includes(mbtiType)) {
+    if (mbtiType && NT_TYPES.has(mbtiType)) {
       formalityLevel = 'professional';
       technicalDepth = 'detailed';
-    } else if (mbtiType && ['ISFP', 'ESFP', 'INFP', 'ENFP'].includes(mbtiType)) {
+    } else if (mbtiType && FP_TYPES.has(mbtiType)) {
       formalityLevel = 'casual';
       metaphorUsage = 'frequent';
     }
@@ -176,9 +185,9 @@ export class VoiceTokenGenerator {
 
     let basePhrases = ['Let\'s explore this together', 'I hear you', 'Trust the process'];
 
-    if (mbtiType && ['INFJ', 'ENFJ', 'INFP', 'ENFP'].includes(mbtiType)) {
+    if (mbtiType && NF_TYPES.has(mbtiType)) {
       basePhrases = ['What feels right to you?', 'How can I support you?', 'You have the answers'];
-    } else if (mbtiType && ['ISTP', 'ESTP', 'ISTJ', 'ESTJ'].includes(mbtiType)) {
+    } else if (mbtiType && ST_TYPES.has(mbtiType)) {
       basePhrases = ['Let\'s get to the point', 'What are the facts?', 'What\'s the plan?'];
     }
 
@@ -246,9 +255,9 @@ export class VoiceTokenGenerator {
 
     let baseTransitions = ['Now', 'Moving forward', 'Consider this'];
 
-    if (mbtiType && ['INTJ', 'ENTJ', 'ISTP', 'ESTP'].includes(mbtiType)) {
+    if (mbtiType && DIRECT_TRANSITION_TYPES.has(mbtiType)) {
       baseTransitions = ['Next', 'Therefore', 'In conclusion'];
-    } else if (mbtiType && ['INFP', 'ENFP', 'ISFJ', 'ESFJ'].includes(mbtiType)) {
+    } else if (mbtiType && CONNECTIVE_TRANSITION_TYPES.has(mbtiType)) {
       baseTransitions = ['Also', 'Additionally', 'On the other hand'];
     }
 
@@ -274,32 +283,36 @@ export class VoiceTokenGenerator {
     return baseTransitions;
   }
 
+  // Fallback tokens are the same every time and only ever read, so share one
+  // frozen instance instead of rebuilding it on each failed generation
+  private static readonly DEFAULT_VOICE_TOKENS: VoiceTokens = Object.freeze({
+    pacing: Object.freeze({
+      sentenceLength: 'medium',
+      pauseFrequency: 'thoughtful',
+      rhythmPattern: 'steady'
+    }),
+    expressiveness: Object.freeze({
+      emojiFrequency: 'occasional',
+      emphasisStyle: 'subtle',
+      exclamationTendency: 'balanced'
+    }),
+    vocabulary: Object.freeze({
+      formalityLevel: 'conversational',
+      metaphorUsage: 'occasional',
+      technicalDepth: 'balanced'
+    }),
+    conversationStyle: Object.freeze({
+      questionAsking: 'exploratory',
+      responseLength: 'thorough',
+      personalSharing: 'relevant'
+    }),
+    signaturePhrases: [],
+    greetingStyles: [],
+    transitionWords: []
+  });
+
   private static getDefaultVoiceTokens(): VoiceTokens {
-    return {
-      pacing: {
-        sentenceLength: 'medium',
-        pauseFrequency: 'thoughtful',
-        rhythmPattern: 'steady'
-      },
-      expressiveness: {
-        emojiFrequency: 'occasional',
-        emphasisStyle: 'subtle',
-        exclamationTendency: 'balanced'
-      },
-      vocabulary: {
-        formalityLevel: 'conversational',
-        metaphorUsage: 'occasional',
-        technicalDepth: 'balanced'
-      },
-      conversationStyle: {
-        questionAsking: 'exploratory',
-        responseLength: 'thorough',
-        personalSharing: 'relevant'
-      },
-      signaturePhrases: [],
-      greetingStyles: [],
-      transitionWords: []
-    };
+    return this.DEFAULT_VOICE_TOKENS;
   }
 
   // NEW AUTONOMOUS METHODS FOR ORACLE-STYLE COMMUNICATION
@@ -44,6 +44,28 @@ const MBTI_COGNITIVE_FUNCTIONS: Record<string, CognitiveFunctions> = {
   ESFP: { dominant: 'Se', auxiliary: 'Fi', tertiary: 'Te', inferior: 'Ni' }
 };
 
+const COGNITIVE_FUNCTION_NAMES: Record<string, string> = {
+  Ne: 'Extraverted Intuition', Ni: 'Introverted Intuition',
+  Se: 'Extraverted Sensing', Si: 'Introverted Sensing',
+  Te: 'Extraverted Thinking', Ti: 'Introverted Thinking',
+  Fe: 'Extraverted Feeling', Fi: 'Introverted Feeling'
+};
+
+/**
+ * Dominant and auxiliary function names for all 16 types, derived once from
+ * the stacks above so callers resolve a type with a single lookup
+ */
+export const MBTI_FUNCTION_NAMES: Readonly<Record<string, Readonly<{ dominant: string; auxiliary: string }>>> =
+  Object.freeze(Object.fromEntries(
+    Object.entries(MBTI_COGNITIVE_FUNCTIONS).map(([type, stack]) => [
+      type,
+      Object.freeze({
+        dominant: COGNITIVE_FUNCTION_NAMES[stack.dominant],
+        auxiliary: COGNITIVE_FUNCTION_NAMES[stack.auxiliary]
+      })
+    ])
+  ));
+
 /**
  * Get cognitive functions for a given MBTI type
  */
@@ -52,20 +74,20 @@ export const getCognitiveFunctions = (mbtiType: string): CognitiveFunctions | nu
   return MBTI_COGNITIVE_FUNCTIONS[normalizedType] || null;
 };
 
+const COGNITIVE_FUNCTION_DESCRIPTIONS: Readonly<Record<string, string>> = Object.freeze({
+  'Ne': 'Extraverted Intuition - Exploring possibilities',
+  'Ni': 'Introverted Intuition - Pattern recognition',
+  'Se': 'Extraverted Sensing - Present awareness',
+  'Si': 'Introverted Sensing - Memory & detail',
+  'Te': 'Extraverted Thinking - Logical organization',
+  'Ti': 'Introverted Thinking - Analytical reasoning',
+  'Fe': 'Extraverted Feeling - Social harmony',
+  'Fi': 'Introverted Feeling - Personal values'
+});
+
 /**
  * Get full function name with description
  */
 export const getCognitiveFunctionDescription = (functionCode: string): string => {
-  const descriptions: Record<string, string> = {
-    'Ne': 'Extraverted Intuition - Exploring possibilities',
-    'Ni': 'Introverted Intuition - Pattern recognition',
-    'Se': 'Extraverted Sensing - Present awareness',
-    'Si': 'Introverted Sensing - Memory & detail',
-    'Te': 'Extraverted Thinking - Logical organization',
-    'Ti': 'Introverted Thinking - Analytical reasoning',
-    'Fe': 'Extraverted Feeling - Social harmony',
-    'Fi': 'Introverted Feeling - Personal values'
-  };
-  
-  return descriptions[functionCode] || functionCode;
+  return COGNITIVE_FUNCTION_DESCRIPTIONS[functionCode] || functionCode;
 };
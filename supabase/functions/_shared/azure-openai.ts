@@ -43,6 +43,14 @@ const AZURE_OPENAI_EMBEDDINGS_API_VERSION = sanitizeEnv(Deno.env.get('AZURE_OPEN
 // Fallback
 const OPENAI_API_KEY = Deno.env.get('OPENAI_API_KEY');
 
+// Direct-OpenAI request headers never change for the life of the isolate, so
+// build them once. Deno's fetch is already non-blocking and keeps the TLS
+// connection to api.openai.com alive between calls on the same isolate.
+const OPENAI_DIRECT_HEADERS: Record<string, string> = {
+  'Authorization': `Bearer ${OPENAI_API_KEY}`,
+  'Content-Type': 'application/json',
+};
+
 /**
  * Whether Azure OpenAI is fully configured (at least chat).
  */
@@ -71,6 +79,49 @@ function getDeploymentName(model: string): string {
   return MODEL_TO_DEPLOYMENT[model] || model;
 }
 
+// ── Retry policy ──
+// Rate limits (429) and transient upstream failures are retried with jittered
+// exponential backoff, honouring Retry-After when the API sends one. The
+// status arrives before any body, so this is safe for streaming calls too.
+const MAX_ATTEMPTS = 3;
+const BASE_DELAY_MS = 1000;
+const MAX_DELAY_MS = 30000;
+const RETRYABLE_STATUSES = new Set([429, 500, 502, 503, 504]);
+
+function retryDelayMs(attempt: number, retryAfter: string | null): number {
+  const retryAfterSeconds = retryAfter ? Number(retryAfter) : NaN;
+  if (Number.isFinite(retryAfterSeconds) && retryAfterSeconds >= 0) {
+    return Math.min(retryAfterSeconds * 1000, MAX_DELAY_MS);
+  }
+  const ceiling = Math.min(BASE_DELAY_MS * 2 ** attempt, MAX_DELAY_MS);
+  return BASE_DELAY_MS / 2 + Math.random() * (ceiling - BASE_DELAY_MS / 2);
+}
+
+async function fetchWithRetry(url: string, init: RequestInit): Promise<Response> {
+  for (let attempt = 1; ; attempt++) {
+    let response: Response;
+    try {
+      response = await fetch(url, init);
+    } catch (error) {
+      // Network failures are retried; caller aborts are not
+      if (attempt >= MAX_ATTEMPTS || init.signal?.aborted) throw error;
+      const delay = retryDelayMs(attempt, null);
+      console.warn(`🔁 OpenAI request failed (${error instanceof Error ? error.message : error}), retrying in ${Math.round(delay)}ms`);
+      await new Promise((resolve) => setTimeout(resolve, delay));
+      continue;
+    }
+
+    if (!RETRYABLE_STATUSES.has(response.status) || attempt >= MAX_ATTEMPTS || init.signal?.aborted) {
+      return response;
+    }
+
+    const delay = retryDelayMs(attempt, response.headers.get('retry-after'));
+    console.warn(`🔁 OpenAI returned ${response.status}, retrying in ${Math.round(delay)}ms (attempt ${attempt}/${MAX_ATTEMPTS})`);
+    await response.body?.cancel();
+    await new Promise((resolve) => setTimeout(resolve, delay));
+  }
+}
+
 /**
  * Call Azure OpenAI chat completions (or fallback to OpenAI direct).
  */
@@ -113,7 +164,7 @@ export async function callChatCompletion(options: {
 
     console.log(`🔷 Azure Chat: ${deployment}, url=${url}`);
 
-    return fetch(url, {
+    return fetchWithRetry(url, {
       method: 'POST',
       headers: {
         'api-key': AZURE_OPENAI_KEY,
@@ -142,12 +193,9 @@ export async function callChatCompletion(options: {
   if (tools) body.tools = tools;
   if (tool_choice) body.tool_choice = tool_choice;
 
-  return fetch('https://api.openai.com/v1/chat/completions', {
+  return fetchWithRetry('https://api.openai.com/v1/chat/completions', {
     method: 'POST',
-    headers: {
-      'Authorization': `Bearer ${OPENAI_API_KEY}`,
-      'Content-Type': 'application/json',
-    },
+    headers: OPENAI_DIRECT_HEADERS,
     body: JSON.stringify(body),
     ...(signal ? { signal } : {}),
   });
@@ -173,7 +221,7 @@ export async function callEmbeddings(options: {
 
     console.log(`🔷 Azure Embeddings: ${deployment}, url=${url}`);
 
-    return fetch(url, {
+    return fetchWithRetry(url, {
       method: 'POST',
       headers: {
         'api-key': AZURE_OPENAI_EMBEDDINGS_KEY,
@@ -193,12 +241,9 @@ export async function callEmbeddings(options: {
 
   console.log(`⚡ OpenAI Embeddings Direct (fallback): ${model}`);
 
-  return fetch('https://api.openai.com/v1/embeddings', {
+  return fetchWithRetry('https://api.openai.com/v1/embeddings', {
     method: 'POST',
-    headers: {
-      'Authorization': `Bearer ${OPENAI_API_KEY}`,
-      'Content-Type': 'application/json',
-    },
+    headers: OPENAI_DIRECT_HEADERS,
     body: JSON.stringify({
       model,
       input,
@@ -0,0 +1,41 @@
+/**
+ * Per-isolate LRU cache of lookup promises.
+ *
+ * Entries are promises, so concurrent callers for one key share a single
+ * request. Rejected lookups, and results `keep` refuses, are evicted so the
+ * next caller retries them.
+ */
+export function cachedLookup<T>(
+  cache: Map<string, Promise<T>>,
+  key: string,
+  load: () => Promise<T>,
+  limit: number,
+  keep?: (value: T) => boolean
+): Promise<T> {
+  const cached = cache.get(key);
+  if (cached) {
+    // Re-insert on a hit so the entry moves to the most recently used end
+    cache.delete(key);
+    cache.set(key, cached);
+    return cached;
+  }
+
+  if (cache.size >= limit) {
+    // Maps iterate in insertion order, so the first key is the least recently used
+    cache.delete(cache.keys().next().value!);
+  }
+
+  const pending = load();
+  cache.set(key, pending);
+
+  // Only evict our own entry; the key may have been evicted and refilled
+  // by a newer request before this one settled
+  const evict = () => {
+    if (cache.get(key) === pending) cache.delete(key);
+  };
+  pending.then((value) => {
+    if (keep && !keep(value)) evict();
+  }, evict);
+
+  return pending;
+}
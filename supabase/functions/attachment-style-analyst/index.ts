@@ -1,4 +1,3 @@
-import "https://deno.land/x/xhr@0.1.0/mod.ts";
 import { serve } from "https://deno.land/std@0.168.0/http/server.ts";
 import { callChatCompletion } from "../_shared/azure-openai.ts";
 
@@ -29,7 +28,7 @@ As the Attachment Style Analyst, analyze relational patterns, repair tendencies,
 
 HERMETIC ANALYSIS INPUT: ${hermeticChunk}
 PREVIOUS INSIGHTS: ${previousInsights}
-BLUEPRINT CONTEXT: ${JSON.stringify(blueprintContext, null, 2)}
+BLUEPRINT CONTEXT: ${JSON.stringify(blueprintContext)}
 
 Generate a comprehensive 3,000-4,000 word analysis covering attachment patterns, relationship dynamics, and authority archetype interactions.
 `;
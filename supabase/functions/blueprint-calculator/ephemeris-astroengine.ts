@@ -1,6 +1,4 @@
 
-import { serve } from "https://deno.land/std@0.168.0/http/server.ts";
-
 // Test import immediately
 console.log("🔧 EPHEMERIS MODULE: Starting to load...");
 
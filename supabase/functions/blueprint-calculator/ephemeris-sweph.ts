@@ -1,5 +1,4 @@
 
-import { serve } from 'https://deno.land/std@0.168.0/http/server.ts';
 import { initializeSwephModule } from '../_shared/sweph/sweph-loader.ts';
 
 /**
@@ -1,5 +1,5 @@
 
-import { formatInTimeZone, toZonedTime, fromZonedTime } from "date-fns-tz";
+import { fromZonedTime } from "date-fns-tz";
 
 interface GeoCoordinates {
   latitude: number;
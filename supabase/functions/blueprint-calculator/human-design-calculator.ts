@@ -1,6 +1,20 @@
 
+import { cachedLookup } from "../_shared/lookup-cache.ts";
+
 // HONEST Human Design calculation with NO hardcoded fallbacks or cheating
 
+// Step-by-step chart tracing (every gate conversion, every planet) is only
+// wanted while debugging; set HD_DEBUG=true to turn it on. Per-planet call
+// sites check the flag and log directly, so their message strings are never
+// built otherwise; everything else goes through debugLog.
+const HD_DEBUG = Deno.env.get("HD_DEBUG") === "true";
+
+function debugLog(...args: unknown[]) {
+  if (HD_DEBUG) {
+    console.log(...args);
+  }
+}
+
 export async function calculateHumanDesign(
   birthDate: string,
   birthTime: string,
@@ -98,13 +112,20 @@ const CHANNELS = [
 
 const PROFILE_LABELS = {1:"Investigator",2:"Hermit",3:"Martyr",4:"Opportunist",5:"Heretic",6:"Role Model"};
 
+// Strategy and not-self theme per type, resolved with a single lookup
+const HD_TYPE_TRAITS: Record<string, { strategy: string; notSelfTheme: string }> = {
+  "Generator": { strategy: "Wait to respond", notSelfTheme: "Frustration" },
+  "Manifesting Generator": { strategy: "Wait to respond then inform", notSelfTheme: "Frustration and anger" },
+  "Manifestor": { strategy: "Inform before acting", notSelfTheme: "Anger" },
+  "Projector": { strategy: "Wait for the invitation", notSelfTheme: "Bitterness" },
+  "Reflector": { strategy: "Wait a lunar cycle", notSelfTheme: "Disappointment" }
+};
+const UNKNOWN_TYPE_TRAITS = { strategy: "Unknown", notSelfTheme: "Unknown" };
+
 // HONEST longitude to gate/line conversion - NO hardcoded test case matches
 function honestLongitudeToGateLine(longitude: number) {
-  console.log(`[HD] Converting longitude ${longitude}° to gate/line using HONEST calculation...`);
-  
   // Normalize longitude to 0-360 range
   const normalized = ((longitude % 360) + 360) % 360;
-  console.log(`[HD] Normalized longitude: ${normalized}°`);
   
   // Each gate covers exactly 5.625 degrees (360/64)
   // Each line covers exactly 0.9375 degrees (5.625/6)
@@ -118,7 +139,11 @@ function honestLongitudeToGateLine(longitude: number) {
   const line = Math.floor(positionInGate / degreesPerLine) + 1;
   const correctedLine = Math.min(Math.max(line, 1), 6);
   
-  console.log(`[HD] Gate index: ${gateIndex}, Gate: ${gate}, Line: ${correctedLine}`);
+  if (HD_DEBUG) {
+    console.log(`[HD] Converting longitude ${longitude}° to gate/line using HONEST calculation...`);
+    console.log(`[HD] Normalized longitude: ${normalized}°`);
+    console.log(`[HD] Gate index: ${gateIndex}, Gate: ${gate}, Line: ${correctedLine}`);
+  }
   
   return { gate, line: correctedLine };
 }
@@ -161,15 +186,17 @@ async function calculateChartHonest({ birthDate, birthTime, coordinates }: {
   const birthDateTime = new Date(`${birthDate}T${birthTime}`);
   const designDateTime = new Date(birthDateTime.getTime() - (88.736 * 24 * 60 * 60 * 1000));
   
-  console.log(`[HD] Birth time: ${birthDateTime.toISOString()}`);
-  console.log(`[HD] Design time: ${designDateTime.toISOString()}`);
+  debugLog(`[HD] Birth time: ${birthDateTime.toISOString()}`);
+  debugLog(`[HD] Design time: ${designDateTime.toISOString()}`);
   
-  // Step 2: Fetch ephemeris for both times - NO fallbacks
-  const pCelestial = await fetchEphemerisData(birthDateTime.toISOString(), coordinates);
-  const dCelestial = await fetchEphemerisData(designDateTime.toISOString(), coordinates);
+  // Step 2: Fetch ephemeris for both times concurrently - NO fallbacks
+  const [pCelestial, dCelestial] = await Promise.all([
+    fetchEphemerisData(birthDateTime.toISOString(), coordinates),
+    fetchEphemerisData(designDateTime.toISOString(), coordinates)
+  ]);
   
-  console.log(`[HD] Personality Sun: ${pCelestial.sun?.longitude}°`);
-  console.log(`[HD] Design Sun: ${dCelestial.sun?.longitude}°`);
+  debugLog(`[HD] Personality Sun: ${pCelestial.sun?.longitude}°`);
+  debugLog(`[HD] Design Sun: ${dCelestial.sun?.longitude}°`);
 
   // Step 3: Compute gates & lines using HONEST conversion - NO hardcoded matches
   function computePlanetGates(celestial: any, label: string) {
@@ -201,10 +228,14 @@ async function calculateChartHonest({ birthDate, birthTime, coordinates }: {
     
     Object.entries(planetMap).forEach(([planet, obj]: [string, any]) => {
       if(obj && typeof obj.longitude === "number") {
-        console.log(`[HD] ${label} ${planet}: ${obj.longitude}° (before conversion)`);
+        if (HD_DEBUG) {
+          console.log(`[HD] ${label} ${planet}: ${obj.longitude}° (before conversion)`);
+        }
         const {gate, line} = honestLongitudeToGateLine(obj.longitude);
         results.push({ planet, gate, line });
-        console.log(`[HD] ${label} ${planet}: ${obj.longitude}° → Gate ${gate}.${line}`);
+        if (HD_DEBUG) {
+          console.log(`[HD] ${label} ${planet}: ${obj.longitude}° → Gate ${gate}.${line}`);
+        }
       } else {
         console.warn(`[HD] Missing or invalid ${planet} data for ${label}:`, obj);
       }
@@ -220,8 +251,8 @@ async function calculateChartHonest({ birthDate, birthTime, coordinates }: {
   const pGates = computePlanetGates(pCelestial, "PERSONALITY");
   const dGates = computePlanetGates(dCelestial, "DESIGN");
   
-  console.log(`[HD] Personality gates count: ${pGates.length}`);
-  console.log(`[HD] Design gates count: ${dGates.length}`);
+  debugLog(`[HD] Personality gates count: ${pGates.length}`);
+  debugLog(`[HD] Design gates count: ${dGates.length}`);
 
   // Step 4: Determine defined centers using HONEST channel logic
   function buildCenters(gateArr: any[]) {
@@ -237,10 +268,13 @@ async function calculateChartHonest({ birthDate, birthTime, coordinates }: {
       Root:{defined:false,gates:[],channels:[]}
     };
     
-    // Add gates to their centers
+    // Add gates to their centers, remembering every active gate in one set so
+    // channel checks below are O(1) instead of scanning each center's gates
+    const activeGates = new Set<number>();
     gateArr.forEach(info => {
       const center = GATE_TO_CENTER_MAP[info.gate];
-      if(center && !centers[center].gates.includes(info.gate)){
+      if(center && !activeGates.has(info.gate)){
+        activeGates.add(info.gate);
         centers[center].gates.push(info.gate);
       }
     });
@@ -250,9 +284,7 @@ async function calculateChartHonest({ birthDate, birthTime, coordinates }: {
       const centerA = GATE_TO_CENTER_MAP[a];
       const centerB = GATE_TO_CENTER_MAP[b];
       
-      if(centerA && centerB && 
-         centers[centerA].gates.includes(a) && 
-         centers[centerB].gates.includes(b)) {
+      if(centerA && centerB && activeGates.has(a) && activeGates.has(b)) {
         
         centers[centerA].defined = true; 
         centers[centerB].defined = true;
@@ -271,7 +303,9 @@ async function calculateChartHonest({ birthDate, birthTime, coordinates }: {
   const allGates = [...pGates, ...dGates];
   const centers = buildCenters(allGates);
   
-  console.log(`[HD] Defined centers:`, Object.keys(centers).filter(c => centers[c].defined));
+  if (HD_DEBUG) {
+    console.log(`[HD] Defined centers:`, Object.keys(centers).filter(c => centers[c].defined));
+  }
 
   // Step 5: HONEST Type logic - NO hardcoded results
   function getType(centers: any) {
@@ -336,34 +370,13 @@ async function calculateChartHonest({ birthDate, birthTime, coordinates }: {
     throw new Error("Missing sun or earth data for profile calculation");
   }
   
-  console.log(`[HD] Personality Sun gate/line: ${pSun.gate}.${pSun.line}`);
-  console.log(`[HD] Design Earth gate/line: ${dEarth.gate}.${dEarth.line}`);
+  debugLog(`[HD] Personality Sun gate/line: ${pSun.gate}.${pSun.line}`);
+  debugLog(`[HD] Design Earth gate/line: ${dEarth.gate}.${dEarth.line}`);
   
   const profileNum = `${pSun.line}/${dEarth.line}`;
   const profile = `${profileNum} (${PROFILE_LABELS[pSun.line]||""}/${PROFILE_LABELS[dEarth.line]||""})`;
   
-  console.log(`[HD] Calculated profile: ${profile}`);
-
-  // Step 8: Strategy & Not-self
-  function getStrategy(type: string) {
-    return {
-      "Generator":"Wait to respond",
-      "Manifesting Generator":"Wait to respond then inform",
-      "Manifestor":"Inform before acting",
-      "Projector":"Wait for the invitation",
-      "Reflector":"Wait a lunar cycle"
-    }[type]||"Unknown";
-  }
-  
-  function getNotSelfTheme(type: string) {
-    return {
-      "Generator":"Frustration",
-      "Manifesting Generator":"Frustration and anger",
-      "Manifestor":"Anger",
-      "Projector":"Bitterness",
-      "Reflector":"Disappointment"
-    }[type]||"Unknown";
-  }
+  debugLog(`[HD] Calculated profile: ${profile}`);
 
   // Step 9: HONEST Definition calculation
   function calculateDefinition(centers: any) {
@@ -404,7 +417,7 @@ async function calculateChartHonest({ birthDate, birthTime, coordinates }: {
       }
     }
     
-    console.log(`[HD] Definition groups: ${groups.length}`, groups);
+    debugLog(`[HD] Definition groups: ${groups.length}`, groups);
     
     if(groups.length === 1) return "Single Definition";
     if(groups.length === 2) return "Split Definition";
@@ -417,8 +430,8 @@ async function calculateChartHonest({ birthDate, birthTime, coordinates }: {
   const type = getType(centers);
   const authority = getAuthority(centers);
   const definition = calculateDefinition(centers);
-  const strategy = getStrategy(type);
-  const not_self_theme = getNotSelfTheme(type);
+  // Step 8: Strategy & Not-self
+  const { strategy, notSelfTheme: not_self_theme } = HD_TYPE_TRAITS[type] || UNKNOWN_TYPE_TRAITS;
   
   console.log(`[HD] HONEST RESULTS:`);
   console.log(`[HD] Type: ${type}`);
@@ -447,18 +460,40 @@ async function calculateChartHonest({ birthDate, birthTime, coordinates }: {
   };
 }
 
-// Geocoding remains unchanged
-async function geocodeLocation(locationName: string): Promise<string | null> {
+// Resolved once per isolate rather than on every geocode
+const GOOGLE_MAPS_API_KEY = Deno.env.get("GOOGLE_MAPS_API_KEY");
+
+// Geocode promises are cached per isolate so repeat birth places (and concurrent
+// charts for the same place) share one request; misses are dropped for retry.
+const GEOCODE_CACHE_LIMIT = 1024;
+const geocodeCache = new Map<string, Promise<string | null>>();
+
+function geocodeLocation(locationName: string): Promise<string | null> {
+  const key = locationName.trim().toLowerCase();
+  return cachedLookup(
+    geocodeCache,
+    key,
+    () => fetchGeocode(locationName),
+    GEOCODE_CACHE_LIMIT,
+    (coordinates) => coordinates !== null
+  );
+}
+
+async function fetchGeocode(locationName: string): Promise<string | null> {
   console.log(`[HD] Geocoding: ${locationName}`);
 
-  const googleApiKey = Deno.env.get("GOOGLE_MAPS_API_KEY");
+  const googleApiKey = GOOGLE_MAPS_API_KEY;
   if (!googleApiKey) return await tryNominatimGeocoding(locationName);
 
   try {
     const encodedLocation = encodeURIComponent(locationName);
     const googleUrl = `https://maps.googleapis.com/maps/api/geocode/json?address=${encodedLocation}&key=${googleApiKey}`;
     const response = await fetch(googleUrl);
-    if (!response.ok) throw new Error(`Google API returned ${response.status}: ${response.statusText}`);
+    if (!response.ok) {
+      // Release the connection back to the keep-alive pool before bailing out
+      await response.body?.cancel();
+      throw new Error(`Google API returned ${response.status}: ${response.statusText}`);
+    }
     const data = await response.json();
     if (data.status === "OK" && data.results && data.results[0]) {
       const { lat, lng } = data.results[0].geometry.location;
@@ -474,7 +509,10 @@ async function geocodeLocation(locationName: string): Promise<string | null> {
 async function tryNominatimGeocoding(locationName: string): Promise<string | null> {
   try {
     const response = await fetch(`https://nominatim.openstreetmap.org/search?format=json&q=${encodeURIComponent(locationName)}&limit=1`);
-    if (!response.ok) throw new Error(`Nominatim API returned ${response.status}`);
+    if (!response.ok) {
+      await response.body?.cancel();
+      throw new Error(`Nominatim API returned ${response.status}`);
+    }
     const data = await response.json();
     if (data && data[0] && data[0].lat && data[0].lon) {
       return `${data[0].lat},${data[0].lon}`;
@@ -1,7 +1,6 @@
 // Human Design calculation module for Blueprint Calculator (refactored using dual ephemeris approach)
 
-import "https://deno.land/x/xhr@0.1.0/mod.ts";
-import { GATE_TO_CENTER_MAP, CHANNELS, HD_PLANETS, PROFILE_LABELS } from "./human-design-gates.ts";
+import { GATE_TO_CENTER_MAP, HD_PLANETS, PROFILE_LABELS } from "./human-design-gates.ts";
 
 export async function calculateHumanDesign(
   birthDate,
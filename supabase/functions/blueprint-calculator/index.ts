@@ -1,4 +1,4 @@
-import { serve } from "https://deno.land/std@0.168.0/http/server.ts";
+import { cachedLookup } from "../_shared/lookup-cache.ts";
 
 // CORS headers for browser requests
 const corsHeaders = {
@@ -6,102 +6,124 @@ const corsHeaders = {
   'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
 };
 
-serve(async (req) => {
+// Preflight answers are empty and cacheable; Max-Age lets the browser skip
+// repeating the preflight for a day
+const PREFLIGHT_HEADERS = {
+  ...corsHeaders,
+  'Access-Control-Max-Age': '86400'
+};
+
+// Every JSON response carries the same headers, so build them once
+const JSON_HEADERS = {
+  "Content-Type": "application/json",
+  ...corsHeaders
+};
+
+// Resolved once per isolate rather than on every lookup
+const VERCEL_API_URL = "https://soul-sync-flow.vercel.app/api/ephemeris";
+const GOOGLE_MAPS_API_KEY = Deno.env.get("GOOGLE_MAPS_API_KEY");
+const RUNTIME_TIMEZONE = Intl.DateTimeFormat().resolvedOptions().timeZone;
+
+// Request fields the main blueprint calculation cannot run without
+const REQUIRED_FIELDS = ['birthDate', 'birthTime', 'birthLocation'] as const;
+
+// Error bodies for the common failure paths, serialized once. A request with
+// no usable body is missing every required field, and a malformed body only
+// varies by the parser message, which is spliced into a fixed template.
+const MISSING_FIELDS_DETAILS = "birthDate, birthTime, and birthLocation are required";
+const ALL_FIELDS_MISSING_BODY = JSON.stringify({
+  error: "Missing required fields",
+  details: MISSING_FIELDS_DETAILS,
+  missing_fields: REQUIRED_FIELDS,
+  code: "MISSING_FIELDS"
+});
+const INVALID_FORMAT_PREFIX = '{"error":"Invalid request format","details":';
+const INVALID_FORMAT_SUFFIX = ',"code":"INVALID_REQUEST_FORMAT"}';
+const EPHEMERIS_REQUEST_HEADERS = {
+  'Content-Type': 'application/json',
+  'Accept': 'application/json',
+  'User-Agent': 'SoulSync-Blueprint-Calculator/1.0',
+};
+
+// Debug and test endpoints, matched in order against the request path. Each
+// module is only loaded when its route is hit. NOTE: test-astronomia endpoint
+// disabled - file renamed to .bak to fix build error
+const DEBUG_ROUTES: ReadonlyArray<[string, () => Promise<{ default: (req: Request) => Promise<Response> }>]> = [
+  // Human Design test endpoint FIRST for testing your specific birth data
+  ['/test-human-design', () => import('./test-human-design.ts')],
+  ['/debug-calculation', () => import('./debug-endpoint.ts')],
+  ['/test-moon-minimal', () => import('./test-moon-minimal.ts')],
+  ['/test-astrometry', () => import('./test-astrometry.ts')],
+  ['/test-available-astronomy', () => import('./test-available-astronomy.ts')],
+  ['/test-wasm', () => import('./test-wasm.ts')],
+  ['/test-prokerala', () => import('./prokerala-api.ts')]
+];
+
+// Deno.serve hands requests straight to the runtime's native HTTP server,
+// without the std/http connection loop sitting in front of it
+Deno.serve(async (req) => {
   // Handle CORS preflight requests
   if (req.method === 'OPTIONS') {
-    return new Response(null, { headers: corsHeaders });
+    return new Response(null, { status: 204, headers: PREFLIGHT_HEADERS });
   }
 
   try {
     const url = new URL(req.url);
     
-    // Add Human Design test endpoint FIRST for testing your specific birth data
-    if (url.pathname.includes('/test-human-design')) {
-      const { default: testHumanDesign } = await import('./test-human-design.ts');
-      return await testHumanDesign(req);
-    }
-    
-    // Add debug endpoint FIRST for testing calculation issues
-    if (url.pathname.includes('/debug-calculation')) {
-      const { default: debugEndpoint } = await import('./debug-endpoint.ts');
-      return await debugEndpoint(req);
-    }
-    
-    // Handle test endpoints FIRST, before any other processing
-    // NOTE: test-astronomia endpoint disabled - file renamed to .bak to fix build error
-    
-    if (url.pathname.includes('/test-moon-minimal')) {
-      const { default: testMoonMinimal } = await import('./test-moon-minimal.ts');
-      return await testMoonMinimal(req);
-    }
-    
-    if (url.pathname.includes('/test-astrometry')) {
-      const { default: testAstrometry } = await import('./test-astrometry.ts');
-      return await testAstrometry(req);
-    }
-    
-    if (url.pathname.includes('/test-available-astronomy')) {
-      const { default: testAvailableAstronomy } = await import('./test-available-astronomy.ts');
-      return await testAvailableAstronomy(req);
-    }
-    
-    if (url.pathname.includes('/test-wasm')) {
-      const { default: testWasm } = await import('./test-wasm.ts');
-      return await testWasm(req);
-    }
-
-    if (url.pathname.includes('/test-prokerala')) {
-      const { default: testProkerala } = await import('./prokerala-api.ts');
-      return await testProkerala(req);
+    // Debug and test endpoints are checked before any other processing
+    for (const [path, load] of DEBUG_ROUTES) {
+      if (url.pathname.includes(path)) {
+        const { default: handler } = await load();
+        return await handler(req);
+      }
     }
 
     // Parse JSON for main blueprint calculation endpoints and POST requests
-    let requestData = {};
+    let requestData: Record<string, any> = {};
     if (req.method === 'POST') {
       const text = await req.text();
-      if (text.trim()) {
+      // Look for any non-whitespace character rather than trimming a copy of the body
+      if (/\S/.test(text)) {
         try {
           requestData = JSON.parse(text);
         } catch (parseError) {
           console.error("Failed to parse request body:", parseError);
           return new Response(
-            JSON.stringify({ 
-              error: "Invalid request format",
-              details: parseError.message,
-              code: "INVALID_REQUEST_FORMAT"
-            }),
+            INVALID_FORMAT_PREFIX + JSON.stringify(parseError.message) + INVALID_FORMAT_SUFFIX,
             { 
               status: 400,
-              headers: { 
-                "Content-Type": "application/json",
-                ...corsHeaders 
-              } 
+              headers: JSON_HEADERS
             }
           );
         }
       }
     }
 
-    const { birthDate, birthTime, birthLocation, fullName } = requestData;
+    // Validate required fields for main blueprint calculation in one pass;
+    // they must be non-empty strings since they are parsed and interpolated
+    const missingFields = REQUIRED_FIELDS.filter(
+      (field) => typeof requestData[field] !== 'string' || !requestData[field]
+    );
 
-    // Validate required fields for main blueprint calculation
-    if (!birthDate || !birthTime || !birthLocation) {
+    if (missingFields.length > 0) {
       return new Response(
-        JSON.stringify({ 
-          error: "Missing required fields",
-          details: "birthDate, birthTime, and birthLocation are required",
-          code: "MISSING_FIELDS"
-        }),
+        missingFields.length === REQUIRED_FIELDS.length
+          ? ALL_FIELDS_MISSING_BODY
+          : JSON.stringify({ 
+              error: "Missing required fields",
+              details: MISSING_FIELDS_DETAILS,
+              missing_fields: missingFields,
+              code: "MISSING_FIELDS"
+            }),
         { 
           status: 400,
-          headers: { 
-            "Content-Type": "application/json",
-            ...corsHeaders 
-          } 
+          headers: JSON_HEADERS
         }
       );
     }
 
+    const { birthDate, birthTime, birthLocation, fullName } = requestData;
+
     console.log("Blueprint Calculator: Processing request", {
       birthDate,
       birthTime,
@@ -110,7 +132,7 @@ serve(async (req) => {
     });
 
     // Call the enhanced blueprint generation with automatic timezone resolution
-    const result = await generateBlueprintWithAutomaticTimezone(birthDate, birthTime, birthLocation, fullName);
+    const result = await getBlueprint(birthDate, birthTime, birthLocation, fullName);
 
     return new Response(JSON.stringify({
       success: true,
@@ -119,10 +141,7 @@ serve(async (req) => {
       source: "vercel_ephemeris_api_with_auto_timezone",
       notice: "Using accurate Swiss Ephemeris calculations with automatic timezone resolution"
     }), {
-      headers: { 
-        "Content-Type": "application/json",
-        ...corsHeaders 
-      }
+      headers: JSON_HEADERS
     });
 
   } catch (error) {
@@ -136,18 +155,41 @@ serve(async (req) => {
       }),
       { 
         status: 500,
-        headers: { 
-          "Content-Type": "application/json",
-          ...corsHeaders 
-        } 
+        headers: JSON_HEADERS
       }
     );
   }
 });
 
+// Once geocoding and the ephemeris have answered, a blueprint depends only on
+// the birth data and name, so repeat requests (refreshes, regenerations) reuse
+// the per-isolate result; only the calculated_at stamp is refreshed on each
+// response. Degraded results are not kept, so the next request recomputes them:
+// blueprints built on fallback coordinates after a transient geocoding error,
+// and Human Design failures, which come back as an ERROR chart, not a rejection.
+const BLUEPRINT_CACHE_LIMIT = 256;
+const blueprintCache = new Map<string, Promise<any>>();
+
+async function getBlueprint(birthDate: string, birthTime: string, birthLocation: string, fullName?: string) {
+  const key = JSON.stringify([birthDate, birthTime, birthLocation, fullName || ""]);
+  const blueprint = await cachedLookup(
+    blueprintCache,
+    key,
+    () => generateBlueprintWithAutomaticTimezone(birthDate, birthTime, birthLocation, fullName),
+    BLUEPRINT_CACHE_LIMIT,
+    (result) => !result.calculation_metadata?.geocoding_fallback && result.humanDesign?.type !== "ERROR"
+  );
+
+  return {
+    ...blueprint,
+    calculation_metadata: {
+      ...blueprint.calculation_metadata,
+      calculated_at: new Date().toISOString()
+    }
+  };
+}
+
 async function generateBlueprintWithAutomaticTimezone(birthDate: string, birthTime: string, birthLocation: string, fullName?: string) {
-  const VERCEL_API_URL = "https://soul-sync-flow.vercel.app/api/ephemeris";
-  
   try {
     console.log("Step 1: Geocoding location to get coordinates...");
     
@@ -172,48 +214,25 @@ async function generateBlueprintWithAutomaticTimezone(birthDate: string, birthTi
     console.log(`Local birth time: ${birthDateTime.toISOString()}`);
     console.log(`Accurate UTC time: ${accurateUtcDateTime.toISOString()}`);
     
-    console.log("Step 4: Calling Vercel ephemeris API with accurate data...");
-    
-    // Step 4: Call Vercel API with accurate UTC time and coordinates
-    const ephemerisResponse = await fetch(VERCEL_API_URL, {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/json',
-        'Accept': 'application/json',
-        'User-Agent': 'SoulSync-Blueprint-Calculator/1.0',
-      },
-      body: JSON.stringify({
-        datetime: accurateUtcDateTime.toISOString(),
-        coordinates: `${coordinates.latitude},${coordinates.longitude}`
-      })
-    });
+    console.log("Step 4: Calling Vercel ephemeris API and Human Design calculation concurrently...");
     
-    console.log("Vercel API response status:", ephemerisResponse.status);
-    
-    if (!ephemerisResponse.ok) {
-      const errorText = await ephemerisResponse.text();
-      console.error("Vercel API error response:", errorText);
-      throw new Error(`Ephemeris API returned ${ephemerisResponse.status}: ${ephemerisResponse.statusText}. Response: ${errorText}`);
-    }
-    
-    const ephemerisData = await ephemerisResponse.json();
-    
-    if (!ephemerisData.success) {
-      throw new Error(`Ephemeris API error: ${ephemerisData.error || 'Unknown error'}`);
-    }
+    // Step 4: Call Vercel API with accurate UTC time and coordinates. The Human
+    // Design chart is independent of this response, so compute it alongside.
+    const [celestialData, humanDesign] = await Promise.all([
+      getEphemerisData(accurateUtcDateTime, coordinates),
+      generateHumanDesign(birthDate, birthTime, birthLocation, RUNTIME_TIMEZONE)
+    ]);
     
     console.log("Step 5: Processing accurate ephemeris data...");
     
-    // Process the accurate planetary data
-    const celestialData = ephemerisData.data;
-    
     // Generate Western astrology profile
     const westernProfile = generateWesternProfile(celestialData);
     
-    // Generate other profile components
-    const chineseZodiac = calculateChineseZodiac(new Date(birthDate).getFullYear());
-    const numerology = calculateNumerology(birthDate, fullName || "Sample Name");
-    const humanDesign = await generateHumanDesign(birthDate, birthTime, birthLocation, Intl.DateTimeFormat().resolvedOptions().timeZone);
+    // Generate other profile components; the date fields are parsed once and
+    // shared by every section that needs them
+    const birth = parseBirthDate(birthDate);
+    const chineseZodiac = calculateChineseZodiac(birth.year);
+    const numerology = calculateNumerology(birthDate, birth.day, fullName || "Sample Name");
     
     return {
       calculation_metadata: {
@@ -222,6 +241,7 @@ async function generateBlueprintWithAutomaticTimezone(birthDate: string, birthTi
         errors: {},
         calculated_at: new Date().toISOString(),
         engine: "swiss_ephemeris_vercel_auto_timezone",
+        geocoding_fallback: coordinates.fallback === true,
         timezone_info: {
           location: birthLocation,
           coordinates: `${coordinates.latitude},${coordinates.longitude}`,
@@ -245,9 +265,38 @@ async function generateBlueprintWithAutomaticTimezone(birthDate: string, birthTi
   }
 }
 
+// Geocoding and timezone lookups repeat heavily: the same birth cities come up
+// across users, and a single blueprint request resolves them more than once.
+// Cache the lookup promises per isolate so repeats (and concurrent callers)
+// share one request; failed lookups are evicted so they can be retried, and so
+// are city fallbacks taken after a transient geocoding failure.
+const LOOKUP_CACHE_LIMIT = 1024;
+const coordinatesCache = new Map<string, Promise<Coordinates>>();
+const timezoneIdCache = new Map<string, Promise<string>>();
+
+// fallback marks coordinates guessed from the city list while the geocoder was
+// unavailable; they are used for this request but never cached
+type Coordinates = { latitude: number; longitude: number; fallback?: boolean };
+
+function getLocationCoordinates(location: string): Promise<Coordinates> {
+  const key = location.trim().toLowerCase();
+  return cachedLookup(
+    coordinatesCache,
+    key,
+    () => fetchLocationCoordinates(location),
+    LOOKUP_CACHE_LIMIT,
+    (coordinates) => !coordinates.fallback
+  );
+}
+
+function getTimezoneId(coordinates: {latitude: number, longitude: number}): Promise<string> {
+  const key = `${coordinates.latitude.toFixed(4)},${coordinates.longitude.toFixed(4)}`;
+  return cachedLookup(timezoneIdCache, key, () => fetchTimezoneId(coordinates), LOOKUP_CACHE_LIMIT);
+}
+
 // Get geographic coordinates from location string using Google Maps Geocoding API
-async function getLocationCoordinates(location: string): Promise<{latitude: number, longitude: number}> {
-  const apiKey = Deno.env.get("GOOGLE_MAPS_API_KEY");
+async function fetchLocationCoordinates(location: string): Promise<Coordinates> {
+  const apiKey = GOOGLE_MAPS_API_KEY;
   
   if (!apiKey) {
     console.error("Google Maps API key not found");
@@ -273,11 +322,13 @@ async function getLocationCoordinates(location: string): Promise<{latitude: numb
   if (data.status !== "OK" || !data.results || data.results.length === 0) {
     console.error("Geocoding failed:", data.status, data.error_message);
     
-    // Fallback to major cities if geocoding fails
+    // Fallback to major cities if geocoding fails. Only a definitive
+    // ZERO_RESULTS answer makes the fallback safe to cache; quota and server
+    // errors are transient, so those results are tagged for a retry next time
     const fallbackCoords = getFallbackCoordinates(location);
     if (fallbackCoords) {
       console.log(`Using fallback coordinates for ${location}:`, fallbackCoords);
-      return fallbackCoords;
+      return data.status === "ZERO_RESULTS" ? fallbackCoords : { ...fallbackCoords, fallback: true };
     }
     
     throw new Error(`Could not determine coordinates for location: ${location}`);
@@ -290,17 +341,64 @@ async function getLocationCoordinates(location: string): Promise<{latitude: numb
   };
 }
 
-// Get historical timezone offset using Google Maps Timezone API
+// Get historical timezone offset for a birth moment. Only the IANA zone name
+// needs the Google Maps Timezone API (once per location); the offset itself
+// comes from the runtime's tz database, which carries the historical DST rules.
 async function getHistoricalTimezoneOffset(coordinates: {latitude: number, longitude: number}, dateTime: Date): Promise<number> {
-  const apiKey = Deno.env.get("GOOGLE_MAPS_API_KEY");
+  // Override incorrect Google API result for Suriname historical timezone
+  // Suriname was UTC-3 in 1978, not UTC-3.5 as Google might return
+  if (coordinates.latitude > 5 && coordinates.latitude < 6 && 
+      coordinates.longitude > -56 && coordinates.longitude < -54) {
+    console.log("🔧 Applying historical timezone correction for Suriname - using UTC-3 instead of Google result");
+    return -3 * 3600; // Force correct historical timezone: -3 hours in seconds
+  }
+
+  const timeZoneId = await getTimezoneId(coordinates);
+  const totalOffsetSeconds = getZoneOffsetSeconds(timeZoneId, dateTime);
+
+  console.log(`Timezone details: ${timeZoneId}, total offset: ${totalOffsetSeconds}s`);
+
+  return totalOffsetSeconds;
+}
+
+// Formatters are comparatively expensive to build, so keep one per zone
+const zoneFormatters = new Map<string, Intl.DateTimeFormat>();
+
+// Offset of a zone from UTC at the given instant, in seconds
+function getZoneOffsetSeconds(timeZone: string, dateTime: Date): number {
+  let formatter = zoneFormatters.get(timeZone);
+  if (!formatter) {
+    formatter = new Intl.DateTimeFormat('en-US', {
+      timeZone,
+      hourCycle: 'h23',
+      year: 'numeric', month: 'numeric', day: 'numeric',
+      hour: 'numeric', minute: 'numeric', second: 'numeric'
+    });
+    zoneFormatters.set(timeZone, formatter);
+  }
+
+  const fields: Record<string, number> = {};
+  for (const part of formatter.formatToParts(dateTime)) {
+    if (part.type !== 'literal') fields[part.type] = Number(part.value);
+  }
+
+  // Wall-clock time in the zone, read back as if it were UTC
+  const wallClockAsUtc = Date.UTC(fields.year, fields.month - 1, fields.day, fields.hour, fields.minute, fields.second);
+  const instant = Math.floor(dateTime.getTime() / 1000) * 1000;
+  return Math.round((wallClockAsUtc - instant) / 1000);
+}
+
+// Get the IANA timezone name for a location using Google Maps Timezone API
+async function fetchTimezoneId(coordinates: {latitude: number, longitude: number}): Promise<string> {
+  const apiKey = GOOGLE_MAPS_API_KEY;
   
   if (!apiKey) {
     console.error("Google Maps API key not found");
     throw new Error("Timezone API key not configured");
   }
   
-  // Convert date to Unix timestamp (seconds since 1970)
-  const timestamp = Math.floor(dateTime.getTime() / 1000);
+  // The zone name does not depend on the moment, so any timestamp will do
+  const timestamp = Math.floor(Date.now() / 1000);
   
   const timezoneUrl = `https://maps.googleapis.com/maps/api/timezone/json?location=${coordinates.latitude},${coordinates.longitude}&timestamp=${timestamp}&key=${apiKey}`;
   
@@ -312,42 +410,29 @@ async function getHistoricalTimezoneOffset(coordinates: {latitude: number, longi
     throw new Error(`Timezone API failed: ${data.status} - ${data.errorMessage || 'Unknown error'}`);
   }
   
-  // The timezone API returns rawOffset (standard time offset) + dstOffset (daylight saving offset)
-  const totalOffsetSeconds = data.rawOffset + data.dstOffset;
-  
-  console.log(`Timezone details: ${data.timeZoneId}, raw offset: ${data.rawOffset}s, DST offset: ${data.dstOffset}s, total: ${totalOffsetSeconds}s`);
-  
-  // Override incorrect Google API result for Suriname historical timezone
-  // Suriname was UTC-3 in 1978, not UTC-3.5 as Google might return
-  if (coordinates.latitude > 5 && coordinates.latitude < 6 && 
-      coordinates.longitude > -56 && coordinates.longitude < -54) {
-    console.log("🔧 Applying historical timezone correction for Suriname - using UTC-3 instead of Google result");
-    return -3 * 3600; // Force correct historical timezone: -3 hours in seconds
-  }
-  
-  return totalOffsetSeconds;
+  return data.timeZoneId;
 }
 
 // Fallback coordinates for major cities if geocoding fails
+const FALLBACK_LOCATIONS: Record<string, {latitude: number, longitude: number}> = {
+  "paramaribo": { latitude: 5.8520, longitude: -55.2038 },
+  "suriname": { latitude: 5.8520, longitude: -55.2038 },
+  "london": { latitude: 51.5074, longitude: -0.1278 },
+  "new york": { latitude: 40.7128, longitude: -74.0060 },
+  "paris": { latitude: 48.8566, longitude: 2.3522 },
+  "tokyo": { latitude: 35.6762, longitude: 139.6503 },
+  "berlin": { latitude: 52.5200, longitude: 13.4050 },
+  "los angeles": { latitude: 34.0522, longitude: -118.2437 },
+  "chicago": { latitude: 41.8781, longitude: -87.6298 },
+  "beijing": { latitude: 39.9042, longitude: 116.4074 },
+  "sydney": { latitude: -33.8688, longitude: 151.2093 },
+  "amsterdam": { latitude: 52.3676, longitude: 4.9041 }
+};
+
 function getFallbackCoordinates(location: string): {latitude: number, longitude: number} | null {
   const normalizedLocation = location.toLowerCase().trim();
   
-  const locationMap: Record<string, {latitude: number, longitude: number}> = {
-    "paramaribo": { latitude: 5.8520, longitude: -55.2038 },
-    "suriname": { latitude: 5.8520, longitude: -55.2038 },
-    "london": { latitude: 51.5074, longitude: -0.1278 },
-    "new york": { latitude: 40.7128, longitude: -74.0060 },
-    "paris": { latitude: 48.8566, longitude: 2.3522 },
-    "tokyo": { latitude: 35.6762, longitude: 139.6503 },
-    "berlin": { latitude: 52.5200, longitude: 13.4050 },
-    "los angeles": { latitude: 34.0522, longitude: -118.2437 },
-    "chicago": { latitude: 41.8781, longitude: -87.6298 },
-    "beijing": { latitude: 39.9042, longitude: 116.4074 },
-    "sydney": { latitude: -33.8688, longitude: 151.2093 },
-    "amsterdam": { latitude: 52.3676, longitude: 4.9041 }
-  };
-  
-  for (const [key, coords] of Object.entries(locationMap)) {
+  for (const [key, coords] of Object.entries(FALLBACK_LOCATIONS)) {
     if (normalizedLocation.includes(key)) {
       return coords;
     }
@@ -362,23 +447,19 @@ function generateWesternProfile(celestialData: any) {
   const moonData = celestialData.planets?.moon || celestialData.moon;
   
   if (!sunData || !moonData) {
-    console.error("Celestial data structure:", JSON.stringify(celestialData, null, 2));
+    console.error("Celestial data structure:", celestialData);
     throw new Error("Missing essential planetary data from ephemeris");
   }
   
-  // Calculate zodiac signs from longitude
-  const sunSign = calculateSignFromLongitude(sunData.longitude);
-  const moonSign = calculateSignFromLongitude(moonData.longitude);
-  
-  // Calculate degrees within sign
-  const sunDegree = sunData.longitude % 30;
-  const moonDegree = moonData.longitude % 30;
+  // Calculate zodiac sign and degree within sign from longitude
+  const sun = signPositionFromLongitude(sunData.longitude);
+  const moon = signPositionFromLongitude(moonData.longitude);
   
   return {
-    sun_sign: `${sunSign} ${sunDegree.toFixed(1)}°`,
-    sun_keyword: getSunKeyword(sunSign),
-    moon_sign: `${moonSign} ${moonDegree.toFixed(1)}°`,
-    moon_keyword: getMoonKeyword(moonSign),
+    sun_sign: `${sun.sign} ${sun.degree.toFixed(1)}°`,
+    sun_keyword: sun.sunKeyword,
+    moon_sign: `${moon.sign} ${moon.degree.toFixed(1)}°`,
+    moon_keyword: moon.moonKeyword,
     rising_sign: "Calculating...", // Would need birth time and location for accurate calculation
     source: "swiss_ephemeris_accurate_timezone"
   };
@@ -388,9 +469,13 @@ async function generateHumanDesign(birthDate: string, birthTime: string, birthLo
   console.log("🎯 Human Design: Starting calculation with Vercel API integration");
   
   try {
-    // Step 1: Get accurate celestial data
+    // Step 1: Get accurate celestial data. Loading the calculator module does
+    // not depend on it, so that happens while the lookups are in flight.
     console.log("Step 1: Getting celestial data for Human Design...");
-    const celestialData = await getAccurateCelestialData(birthDate, birthTime, birthLocation, timezone);
+    const [celestialData, { calculateHumanDesign }] = await Promise.all([
+      getAccurateCelestialData(birthDate, birthTime, birthLocation, timezone),
+      import('./human-design-calculator.ts')
+    ]);
     
     if (!celestialData || !celestialData.planets) {
       throw new Error("Failed to get celestial data for Human Design calculation");
@@ -398,7 +483,6 @@ async function generateHumanDesign(birthDate: string, birthTime: string, birthLo
     
     // Step 2: Call the Human Design calculation (now via Vercel API)
     console.log("Step 2: Calling Human Design calculation via Vercel API...");
-    const { calculateHumanDesign } = await import('./human-design-calculator.ts');
     const humanDesignResult = await calculateHumanDesign(
       birthDate,
       birthTime,
@@ -427,8 +511,6 @@ async function generateHumanDesign(birthDate: string, birthTime: string, birthLo
 
 // Helper function to get accurate celestial data
 async function getAccurateCelestialData(birthDate: string, birthTime: string, birthLocation: string, timezone: string) {
-  const VERCEL_API_URL = "https://soul-sync-flow.vercel.app/api/ephemeris";
-  
   // Step 1: Get coordinates from location string
   const coordinates = await getLocationCoordinates(birthLocation);
   
@@ -442,19 +524,28 @@ async function getAccurateCelestialData(birthDate: string, birthTime: string, bi
   const accurateUtcDateTime = new Date(utcTimestamp);
   
   // Step 4: Call Vercel API with accurate UTC time and coordinates
+  return await getEphemerisData(accurateUtcDateTime, coordinates);
+}
+
+// The western profile and the Human Design chart both need the planets for
+// the same UTC birth moment; share one ephemeris request between them.
+const ephemerisCache = new Map<string, Promise<any>>();
+
+function getEphemerisData(utcDateTime: Date, coordinates: {latitude: number, longitude: number}): Promise<any> {
+  const datetime = utcDateTime.toISOString();
+  const coords = `${coordinates.latitude},${coordinates.longitude}`;
+  return cachedLookup(ephemerisCache, `${datetime}@${coords}`, () => fetchEphemerisData(datetime, coords), LOOKUP_CACHE_LIMIT);
+}
+
+async function fetchEphemerisData(datetime: string, coordinates: string) {
   const ephemerisResponse = await fetch(VERCEL_API_URL, {
     method: 'POST',
-    headers: {
-      'Content-Type': 'application/json',
-      'Accept': 'application/json',
-      'User-Agent': 'SoulSync-Blueprint-Calculator/1.0',
-    },
-    body: JSON.stringify({
-      datetime: accurateUtcDateTime.toISOString(),
-      coordinates: `${coordinates.latitude},${coordinates.longitude}`
-    })
+    headers: EPHEMERIS_REQUEST_HEADERS,
+    body: JSON.stringify({ datetime, coordinates })
   });
   
+  console.log("Vercel API response status:", ephemerisResponse.status);
+  
   if (!ephemerisResponse.ok) {
     const errorText = await ephemerisResponse.text();
     console.error("Vercel API error response:", errorText);
@@ -470,153 +561,178 @@ async function getAccurateCelestialData(birthDate: string, birthTime: string, bi
   return ephemerisData.data;
 }
 
-function calculateSignFromLongitude(longitude: number): string {
-  const signs = ['Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
-                'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces'];
+// One record per sign in zodiac order, so a longitude resolves to its sign and
+// keywords with a single index instead of separate per-table lookups
+const ZODIAC_SIGNS: ReadonlyArray<{ sign: string, sunKeyword: string, moonKeyword: string }> = Object.freeze([
+  { sign: 'Aries', sunKeyword: 'Pioneer', moonKeyword: 'Instinctive' },
+  { sign: 'Taurus', sunKeyword: 'Builder', moonKeyword: 'Stable' },
+  { sign: 'Gemini', sunKeyword: 'Communicator', moonKeyword: 'Curious' },
+  { sign: 'Cancer', sunKeyword: 'Nurturer', moonKeyword: 'Protective' },
+  { sign: 'Leo', sunKeyword: 'Creator', moonKeyword: 'Expressive' },
+  { sign: 'Virgo', sunKeyword: 'Analyst', moonKeyword: 'Caring' },
+  { sign: 'Libra', sunKeyword: 'Harmonizer', moonKeyword: 'Peaceful' },
+  { sign: 'Scorpio', sunKeyword: 'Transformer', moonKeyword: 'Intense' },
+  { sign: 'Sagittarius', sunKeyword: 'Explorer', moonKeyword: 'Free' },
+  { sign: 'Capricorn', sunKeyword: 'Achiever', moonKeyword: 'Responsible' },
+  { sign: 'Aquarius', sunKeyword: 'Innovator', moonKeyword: 'Independent' },
+  { sign: 'Pisces', sunKeyword: 'Dreamer', moonKeyword: 'Intuitive' }
+]);
+
+// Sign record and degree within that sign, from a single ecliptic longitude
+function signPositionFromLongitude(longitude: number) {
   const signIndex = Math.floor(longitude / 30);
-  return signs[signIndex] || 'Aries';
-}
-
-function getSunKeyword(sign: string): string {
-  const keywords: Record<string, string> = {
-    'Aries': 'Pioneer', 'Taurus': 'Builder', 'Gemini': 'Communicator',
-    'Cancer': 'Nurturer', 'Leo': 'Creator', 'Virgo': 'Analyst',
-    'Libra': 'Harmonizer', 'Scorpio': 'Transformer', 'Sagittarius': 'Explorer',
-    'Capricorn': 'Achiever', 'Aquarius': 'Innovator', 'Pisces': 'Dreamer'
+  return {
+    ...(ZODIAC_SIGNS[signIndex] || ZODIAC_SIGNS[0]),
+    degree: longitude % 30
   };
-  return keywords[sign] || 'Explorer';
 }
 
-function getMoonKeyword(sign: string): string {
-  const keywords: Record<string, string> = {
-    'Aries': 'Instinctive', 'Taurus': 'Stable', 'Gemini': 'Curious',
-    'Cancer': 'Protective', 'Leo': 'Expressive', 'Virgo': 'Caring',
-    'Libra': 'Peaceful', 'Scorpio': 'Intense', 'Sagittarius': 'Free',
-    'Capricorn': 'Responsible', 'Aquarius': 'Independent', 'Pisces': 'Intuitive'
+// Birth dates arrive as fixed-width YYYY-MM-DD, so read the fields by position
+function parseBirthDate(birthDate: string): { year: number, month: number, day: number } {
+  return {
+    year: Number(birthDate.slice(0, 4)),
+    month: Number(birthDate.slice(5, 7)),
+    day: Number(birthDate.slice(8, 10))
   };
-  return keywords[sign] || 'Intuitive';
 }
 
-function calculateChineseZodiac(year: number) {
-  const animals = ['Rat', 'Ox', 'Tiger', 'Rabbit', 'Dragon', 'Snake', 'Horse', 'Goat', 'Monkey', 'Rooster', 'Dog', 'Pig'];
-  const elements = ['Metal', 'Water', 'Wood', 'Fire', 'Earth'];
-  const yinYang = ['Yang', 'Yin'];
-  
-  const animalIndex = (year - 1900) % 12;
-  const elementIndex = Math.floor(((year - 1900) % 10) / 2);
-  const yinYangIndex = (year - 1900) % 2;
-  
-  const animal = animals[animalIndex];
-  const element = elements[elementIndex];
-  const polarity = yinYang[yinYangIndex];
-  
-  return {
+const CHINESE_ANIMALS = ['Rat', 'Ox', 'Tiger', 'Rabbit', 'Dragon', 'Snake', 'Horse', 'Goat', 'Monkey', 'Rooster', 'Dog', 'Pig'];
+const CHINESE_ELEMENTS = ['Metal', 'Water', 'Wood', 'Fire', 'Earth'];
+const YIN_YANG = ['Yang', 'Yin'];
+
+// Animal, element and polarity repeat together every 60 years, so the whole
+// sexagenary cycle is built once; entry 0 is 1900, a Yang Metal Rat
+const SEXAGENARY_CYCLE = Object.freeze(Array.from({ length: 60 }, (_, i) => {
+  const animal = CHINESE_ANIMALS[i % 12];
+  const element = CHINESE_ELEMENTS[(i % 10) >> 1];
+  return Object.freeze({
     animal,
     element,
-    yin_yang: polarity,
+    yin_yang: YIN_YANG[i & 1],
     keyword: `${element} ${animal}`,
     source: "calculated"
-  };
+  });
+}));
+
+function calculateChineseZodiac(year: number) {
+  // Positive modulo keeps years before 1900 in range
+  return SEXAGENARY_CYCLE[(((year - 1900) % 60) + 60) % 60];
 }
 
-function calculateNumerology(birthDate: string, fullName: string) {
-  // ---- NAME-BY-NAME REDUCTION HELPERS ----
-  const PythagoreanValues: Record<string, number> = {
-    'A': 1, 'B': 2, 'C': 3, 'D': 4, 'E': 5, 'F': 6, 'G': 7, 'H': 8, 'I': 9,
-    'J': 1, 'K': 2, 'L': 3, 'M': 4, 'N': 5, 'O': 6, 'P': 7, 'Q': 8, 'R': 9,
-    'S': 1, 'T': 2, 'U': 3, 'V': 4, 'W': 5, 'X': 6, 'Y': 7, 'Z': 8
-  };
-  const pureVowels = ['A', 'E', 'I', 'O', 'U'];
+// Pythagorean letter values indexed by char code - 65: A-I = 1-9, J-R = 1-9, S-Z = 1-8
+const PYTHAGOREAN_VALUES = Uint8Array.from({ length: 26 }, (_, i) => (i % 9) + 1);
+
+// A, E, I, O and U as bits of the 0-25 letter index (Y is not a vowel here)
+const VOWEL_MASK = (1 << 0) | (1 << 4) | (1 << 8) | (1 << 14) | (1 << 20);
 
+function isVowel(letterIndex: number): boolean {
+  return ((VOWEL_MASK >>> letterIndex) & 1) === 1;
+}
+
+// Personality and birthday numbers share the same trait keywords
+const TRAIT_KEYWORDS: Record<number, string> = {
+  1: 'Original', 2: 'Sensitive', 3: 'Expressive', 4: 'Practical', 5: 'Versatile',
+  6: 'Responsible', 7: 'Analytical', 8: 'Executive', 9: 'Generous',
+  11: 'Intuitive', 22: 'Master Builder', 33: 'Master Teacher'
+};
+
+// Keyword per reduced number, for each numerology core number
+const NUMEROLOGY_KEYWORDS: Record<string, Record<number, string>> = {
+  life: {
+    1: 'Leader', 2: 'Cooperator', 3: 'Creative', 4: 'Builder', 5: 'Freedom',
+    6: 'Nurturer', 7: 'Seeker', 8: 'Achiever', 9: 'Humanitarian',
+    11: 'Illuminating Visionary', 22: 'Master Builder', 33: 'Master Teacher'
+  },
+  expression: {
+    1: 'Pioneering Leader', 2: 'Diplomatic Peacemaker', 3: 'Creative Communicator',
+    4: 'Practical Organizer', 5: 'Dynamic Adventurer', 6: 'Compassionate Helper',
+    7: 'Analytical Thinker', 8: 'Executive Achiever', 9: 'Humanitarian Visionary',
+    11: 'Inspirational Visionary (Master)', 22: 'Master Manifestor', 33: 'Universal Healer'
+  },
+  soul: {
+    1: 'Independent Pioneer', 2: 'Harmonious Peacemaker', 3: 'Creative Self-Expression',
+    4: 'Stable Security', 5: 'Adventure Freedom', 6: 'Nurturing Service',
+    7: 'Spiritual Understanding', 8: 'Ambitious Manifestor', 9: 'Universal Love',
+    11: 'Spiritual Insight', 22: 'Global Vision', 33: 'Universal Compassion'
+  },
+  personality: TRAIT_KEYWORDS,
+  birthday: TRAIT_KEYWORDS
+};
+
+function calculateNumerology(birthDate: string, birthDay: number, fullName: string) {
+  // ---- NAME-BY-NAME REDUCTION HELPERS ----
   function reduceToSingleDigitWithMasters(num: number): number {
     // Master numbers: 11, 22, 33
     while (num > 9 && num !== 11 && num !== 22 && num !== 33) {
-      num = num.toString().split('').map(Number).reduce((a, b) => a + b, 0);
+      // Digit sum with integer arithmetic rather than string round-trips
+      let digitSum = 0;
+      for (let rest = num; rest > 0; rest = Math.floor(rest / 10)) {
+        digitSum += rest % 10;
+      }
+      num = digitSum;
     }
     return num;
   }
 
-  function reduceNameParts(fullName: string, filterFn: (letter: string) => boolean): number {
-    const nameParts = fullName.toUpperCase().split(/\s+/).filter(Boolean);
-    const reducedParts: number[] = [];
+  // Expression (all letters), Soul Urge (vowels only, Y excluded) and
+  // Personality (consonants only) in one pass. Parts hold only A-Z, so letters
+  // are addressed by their 0-25 index; each part is reduced before adding.
+  function calculateNameNumbers(nameParts: string[]) {
+    let expressionTotal = 0;
+    let soulUrgeTotal = 0;
+    let personalityTotal = 0;
 
     for (const part of nameParts) {
-      const letters = part.replace(/[^A-Z]/g, '').split('').filter(filterFn);
-      const sum = letters.reduce((acc, ch) => acc + (PythagoreanValues[ch] || 0), 0);
-      const reduced = reduceToSingleDigitWithMasters(sum);
-      reducedParts.push(reduced);
+      let vowelSum = 0;
+      let consonantSum = 0;
+      for (let i = 0; i < part.length; i++) {
+        const index = part.charCodeAt(i) - 65;
+        if (isVowel(index)) {
+          vowelSum += PYTHAGOREAN_VALUES[index];
+        } else {
+          consonantSum += PYTHAGOREAN_VALUES[index];
+        }
+      }
+      expressionTotal += reduceToSingleDigitWithMasters(vowelSum + consonantSum);
+      soulUrgeTotal += reduceToSingleDigitWithMasters(vowelSum);
+      personalityTotal += reduceToSingleDigitWithMasters(consonantSum);
     }
 
-    const total = reducedParts.reduce((a, b) => a + b, 0);
-    return reduceToSingleDigitWithMasters(total);
+    return {
+      expressionNumber: reduceToSingleDigitWithMasters(expressionTotal),
+      soulUrgeNumber: reduceToSingleDigitWithMasters(soulUrgeTotal),
+      personalityNumber: reduceToSingleDigitWithMasters(personalityTotal)
+    };
   }
 
   // Life Path: sum ALL digits in birthdate, reduce
   function calculateLifePath(birthDate: string) {
-    // Expects YYYY-MM-DD
-    const digits = birthDate.replace(/[^0-9]/g, '').split('').map(Number);
-    const sum = digits.reduce((a, b) => a + b, 0);
+    // Expects YYYY-MM-DD; sum the digit characters in place, skipping separators
+    let sum = 0;
+    for (let i = 0; i < birthDate.length; i++) {
+      const digit = birthDate.charCodeAt(i) - 48;
+      if (digit >= 0 && digit <= 9) sum += digit;
+    }
     return reduceToSingleDigitWithMasters(sum);
   }
 
-  // Expression: all letters
-  function calculateExpression(fullName: string) {
-    return reduceNameParts(fullName, (ch) => /[A-Z]/.test(ch));
-  }
-  // Soul Urge: vowels only (exclude Y)
-  function calculateSoulUrge(fullName: string) {
-    return reduceNameParts(fullName, (ch) => pureVowels.includes(ch));
-  }
-  // Personality: consonants only (exclude A E I O U)
-  function calculatePersonality(fullName: string) {
-    return reduceNameParts(fullName, (ch) => /[A-Z]/.test(ch) && !pureVowels.includes(ch));
-  }
   // Birthday Number: reduce day only
-  function calculateBirthday(birthDate: string) {
-    const day = parseInt(birthDate.split('-')[2]);
+  function calculateBirthday(day: number) {
     return reduceToSingleDigitWithMasters(day);
   }
 
   // Provide keywords
-  const getKeyword = (type: string, number: number) => {
-    const dictionaries: Record<string, Record<number, string>> = {
-      life: {
-        1: 'Leader', 2: 'Cooperator', 3: 'Creative', 4: 'Builder', 5: 'Freedom',
-        6: 'Nurturer', 7: 'Seeker', 8: 'Achiever', 9: 'Humanitarian',
-        11: 'Illuminating Visionary', 22: 'Master Builder', 33: 'Master Teacher'
-      },
-      expression: {
-        1: 'Pioneering Leader', 2: 'Diplomatic Peacemaker', 3: 'Creative Communicator',
-        4: 'Practical Organizer', 5: 'Dynamic Adventurer', 6: 'Compassionate Helper',
-        7: 'Analytical Thinker', 8: 'Executive Achiever', 9: 'Humanitarian Visionary',
-        11: 'Inspirational Visionary (Master)', 22: 'Master Manifestor', 33: 'Universal Healer'
-      },
-      soul: {
-        1: 'Independent Pioneer', 2: 'Harmonious Peacemaker', 3: 'Creative Self-Expression',
-        4: 'Stable Security', 5: 'Adventure Freedom', 6: 'Nurturing Service',
-        7: 'Spiritual Understanding', 8: 'Ambitious Manifestor', 9: 'Universal Love',
-        11: 'Spiritual Insight', 22: 'Global Vision', 33: 'Universal Compassion'
-      },
-      personality: {
-        1: 'Original', 2: 'Sensitive', 3: 'Expressive', 4: 'Practical', 5: 'Versatile',
-        6: 'Responsible', 7: 'Analytical', 8: 'Executive', 9: 'Generous',
-        11: 'Intuitive', 22: 'Master Builder', 33: 'Master Teacher'
-      },
-      birthday: {
-        1: 'Original', 2: 'Sensitive', 3: 'Expressive', 4: 'Practical', 5: 'Versatile',
-        6: 'Responsible', 7: 'Analytical', 8: 'Executive', 9: 'Generous',
-        11: 'Intuitive', 22: 'Master Builder', 33: 'Master Teacher'
-      }
-    };
-    return dictionaries[type]?.[number] || '';
-  };
+  const getKeyword = (type: string, number: number) => NUMEROLOGY_KEYWORDS[type]?.[number] || '';
+
+  // Calculation. The three name numbers share one pass of name clean-up:
+  // upper-cased parts (first/middle/last) with everything but A-Z removed.
+  const nameParts = fullName.toUpperCase().split(/\s+/)
+    .map((part) => part.replace(/[^A-Z]/g, ''))
+    .filter(Boolean);
 
-  // Calculation
   const lifePathNumber = calculateLifePath(birthDate);
-  const expressionNumber = calculateExpression(fullName);
-  const soulUrgeNumber = calculateSoulUrge(fullName);
-  const personalityNumber = calculatePersonality(fullName);
-  const birthdayNumber = calculateBirthday(birthDate);
+  const { expressionNumber, soulUrgeNumber, personalityNumber } = calculateNameNumbers(nameParts);
+  const birthdayNumber = calculateBirthday(birthDay);
 
   return {
     life_path_number: lifePathNumber,
@@ -1,5 +1,3 @@
-import { serve } from "https://deno.land/std@0.168.0/http/server.ts";
-
 // CORS headers for browser requests
 const corsHeaders = {
   'Access-Control-Allow-Origin': '*',
@@ -71,8 +69,10 @@ export async function calculatePlanetaryPositionsWithProkerala(
     const accessToken = await getProkeralaAccessToken();
     
     // Parse location - assuming format like "New York, NY, USA" or coordinates "lat,lon"
+    // Exactly one comma means "lat,lon"; check with indexOf rather than splitting
     let coordinates: string;
-    if (birthLocation.includes(',') && birthLocation.split(',').length === 2) {
+    const comma = birthLocation.indexOf(',');
+    if (comma !== -1 && birthLocation.indexOf(',', comma + 1) === -1) {
       // Assume it's already in lat,lon format
       coordinates = birthLocation.trim();
     } else {
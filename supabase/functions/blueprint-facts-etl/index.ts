@@ -33,7 +33,7 @@ function extractBlueprintFacts(blueprint: any, userId: string): any[] {
   // Numerology facts - Fixed field mapping to blueprint.numerology with snake_case
   if (blueprint.numerology) {
     const numerology = blueprint.numerology
-    console.log('🔢 Processing numerology data:', JSON.stringify(numerology, null, 2))
+    console.log('🔢 Processing numerology data:', JSON.stringify(numerology))
     
     addFact('numerology', 'life_path', numerology.life_path_number, 'Life Path Number')
     addFact('numerology', 'expression', numerology.expression_number, 'Expression Number') 
@@ -47,7 +47,7 @@ function extractBlueprintFacts(blueprint: any, userId: string): any[] {
   // Human Design facts
   if (blueprint.energy_strategy_human_design) {
     const hd = blueprint.energy_strategy_human_design
-    console.log('🔮 Processing Human Design data:', JSON.stringify(hd, null, 2))
+    console.log('🔮 Processing Human Design data:', JSON.stringify(hd))
     
     addFact('human_design', 'type', hd.type, 'Human Design Type')
     addFact('human_design', 'authority', hd.authority, 'Authority')
@@ -88,7 +88,7 @@ function extractBlueprintFacts(blueprint: any, userId: string): any[] {
   // Astrology facts
   if (blueprint.archetype_western) {
     const astro = blueprint.archetype_western
-    console.log('⭐ Processing astrology data:', JSON.stringify(astro, null, 2))
+    console.log('⭐ Processing astrology data:', JSON.stringify(astro))
     
     addFact('astrology', 'sun_sign', astro.sun_sign, 'Sun Sign')
     addFact('astrology', 'moon_sign', astro.moon_sign, 'Moon Sign') 
@@ -100,7 +100,7 @@ function extractBlueprintFacts(blueprint: any, userId: string): any[] {
   // Chinese Astrology facts
   if (blueprint.archetype_chinese) {
     const chinese = blueprint.archetype_chinese
-    console.log('🐉 Processing Chinese astrology data:', JSON.stringify(chinese, null, 2))
+    console.log('🐉 Processing Chinese astrology data:', JSON.stringify(chinese))
     
     addFact('chinese_astrology', 'animal', chinese.animal, 'Chinese Zodiac Animal')
     addFact('chinese_astrology', 'element', chinese.element, 'Chinese Element')
@@ -114,7 +114,7 @@ function extractBlueprintFacts(blueprint: any, userId: string): any[] {
   if (blueprint.user_meta?.personality?.bigFive) {
     const bigFive = blueprint.user_meta.personality.bigFive
     const confidence = blueprint.user_meta.personality.confidence || {}
-    console.log('🧠 Processing Big Five personality data:', JSON.stringify(bigFive, null, 2))
+    console.log('🧠 Processing Big Five personality data:', JSON.stringify(bigFive))
     
     addFact('big_five', 'openness', bigFive.openness, 'Openness to Experience', confidence.openness || 0.7)
     addFact('big_five', 'conscientiousness', bigFive.conscientiousness, 'Conscientiousness', confidence.conscientiousness || 0.7)
@@ -128,7 +128,7 @@ function extractBlueprintFacts(blueprint: any, userId: string): any[] {
   // Enhanced MBTI with probabilities
   if (blueprint.user_meta?.personality?.mbtiProbabilities) {
     const probabilities = blueprint.user_meta.personality.mbtiProbabilities
-    console.log('🧠 Processing MBTI probabilities:', JSON.stringify(probabilities, null, 2))
+    console.log('🧠 Processing MBTI probabilities:', JSON.stringify(probabilities))
     
     // Get top 3 most likely types
     const sortedTypes = Object.entries(probabilities)
@@ -144,7 +144,7 @@ function extractBlueprintFacts(blueprint: any, userId: string): any[] {
   // User Meta Information
   if (blueprint.user_meta) {
     const userMeta = blueprint.user_meta
-    console.log('👤 Processing user meta data:', JSON.stringify(userMeta, null, 2))
+    console.log('👤 Processing user meta data:', JSON.stringify(userMeta))
     
     addFact('user_info', 'full_name', userMeta.full_name, 'Full Name')
     addFact('user_info', 'preferred_name', userMeta.preferred_name, 'Preferred Name')
@@ -159,7 +159,7 @@ function extractBlueprintFacts(blueprint: any, userId: string): any[] {
   // Enhanced Human Design Gates
   if (blueprint.energy_strategy_human_design?.gates) {
     const gates = blueprint.energy_strategy_human_design.gates
-    console.log('🔮 Processing Human Design gates:', JSON.stringify(gates, null, 2))
+    console.log('🔮 Processing Human Design gates:', JSON.stringify(gates))
     
     // Conscious personality gates
     if (gates.conscious_personality && Array.isArray(gates.conscious_personality)) {
@@ -179,7 +179,7 @@ function extractBlueprintFacts(blueprint: any, userId: string): any[] {
   // Human Design Centers
   if (blueprint.energy_strategy_human_design?.centers) {
     const centers = blueprint.energy_strategy_human_design.centers
-    console.log('🔮 Processing Human Design centers:', JSON.stringify(centers, null, 2))
+    console.log('🔮 Processing Human Design centers:', JSON.stringify(centers))
     
     Object.entries(centers).forEach(([centerName, centerData]: [string, any]) => {
       addFact('human_design_centers', `${centerName.toLowerCase()}_defined`, centerData.defined, `${centerName} Center Defined`)
@@ -1,7 +1,6 @@
 // Companion Oracle Conversation Edge Function
 // Built with SoulSync Protocol - NEVER BREAK FUNCTIONALITY
 // Fixed: Added getPhaseGuidance method to conversation-phase-tracker
-import { serve } from "https://deno.land/std@0.168.0/http/server.ts"
 import { createClient } from 'https://esm.sh/@supabase/supabase-js@2.7.1'
 
 // PHASE 1: Import edge-compatible services from _shared directory
@@ -106,6 +105,16 @@ function detectConversationState(message: string, conversationHistory: any[] = [
   };
 }
 
+// Tally detection signals by type in a single pass instead of one filter per type
+function countSignalTypes(signals: any[] = []) {
+  const counts = { paralinguistic: 0, sentence_form: 0, discourse_marker: 0, cluster_pattern: 0 };
+  for (const signal of signals) {
+    const type = signal.type as keyof typeof counts;
+    if (typeof counts[type] === 'number') counts[type]++;
+  }
+  return counts;
+}
+
 // PERSISTENCE HELPER: Store conversation state in database (SoulSync addon - never breaks existing flow)
 async function persistConversationState(
   supabaseClient: any,
@@ -116,6 +125,8 @@ async function persistConversationState(
   try {
     console.log('📊 PERSISTENCE: Storing conversation state to conversation_state_tracking...');
     
+    const signalCounts = countSignalTypes(detection.signals);
+
     const { data, error } = await supabaseClient
       .from('conversation_state_tracking')
       .insert({
@@ -125,10 +136,10 @@ async function persistConversationState(
         sub_state: detection.subState,
         confidence: detection.confidence,
         signals: detection.signals,
-        paralinguistic_count: detection.signals.filter(s => s.type === 'paralinguistic').length,
-        sentence_form_count: detection.signals.filter(s => s.type === 'sentence_form').length,
-        discourse_marker_count: detection.signals.filter(s => s.type === 'discourse_marker').length,
-        cluster_pattern_count: detection.signals.filter(s => s.type === 'cluster_pattern').length,
+        paralinguistic_count: signalCounts.paralinguistic,
+        sentence_form_count: signalCounts.sentence_form,
+        discourse_marker_count: signalCounts.discourse_marker,
+        cluster_pattern_count: signalCounts.cluster_pattern,
         opening_rule: detection.openingRule || null,
         allowed_next_clusters: detection.allowedNextClusters || []
       });
@@ -256,8 +267,7 @@ async function fuseWithHACSIntelligence(
     sessionId,
     messageLength: userMessage?.length || 0,
     hasOracleResponse: !!oracleResponse,
-    oracleResponseKeys: Object.keys(oracleResponse || {}),
-    stackTrace: new Error().stack?.split('\n').slice(0, 3)
+    oracleResponseKeys: Object.keys(oracleResponse || {})
   });
 
   try {
@@ -1080,7 +1090,7 @@ RESPONSE STRUCTURE (ORACLE-MODE):
   }
 }
 
-serve(async (req) => {
+Deno.serve(async (req) => {
   // Handle CORS preflight requests
   if (req.method === 'OPTIONS') {
     return new Response(null, { headers: corsHeaders });
@@ -2349,15 +2359,16 @@ serve(async (req) => {
     });
 
     // ENHANCED DIAGNOSTICS: Full conversation state analysis
+    const signalCounts = countSignalTypes(conversationState?.detectionResult?.signals);
     console.log('📊 ENHANCED CONVERSATION DIAGNOSTICS:', {
       cluster: conversationState?.detectionResult?.cluster || 'unknown',
       subState: conversationState?.detectionResult?.subState || 'unknown',
       confidence: conversationState?.detectionResult?.confidence || 0,
       signalBreakdown: {
-        paralinguistic: conversationState?.detectionResult?.signals?.filter(s => s.type === 'paralinguistic').length || 0,
-        sentenceForm: conversationState?.detectionResult?.signals?.filter(s => s.type === 'sentence_form').length || 0,
-        discourseMarker: conversationState?.detectionResult?.signals?.filter(s => s.type === 'discourse_marker').length || 0,
-        clusterPattern: conversationState?.detectionResult?.signals?.filter(s => s.type === 'cluster_pattern').length || 0
+        paralinguistic: signalCounts.paralinguistic,
+        sentenceForm: signalCounts.sentence_form,
+        discourseMarker: signalCounts.discourse_marker,
+        clusterPattern: signalCounts.cluster_pattern
       },
       topSignals: conversationState?.detectionResult?.signals
         ?.sort((a, b) => b.weight - a.weight)
@@ -1,6 +1,3 @@
-
-
-import "https://deno.land/x/xhr@0.1.0/mod.ts";
 import { serve } from "https://deno.land/std@0.168.0/http/server.ts";
 import { createClient } from 'https://esm.sh/@supabase/supabase-js@2.7.1'
 import { callChatCompletion } from "../_shared/azure-openai.ts";
@@ -378,11 +375,11 @@ CRITICAL: Each numbered section (1-6) MUST contain detailed analysis, not quotes
       }
     }
 
-    // Final report summary
-    const totalContentSize = JSON.stringify(reportContent).length;
+    // Final report summary (section lengths were already measured during validation)
+    const totalContentSize = validationResults.reduce((total, r) => total + r.length, 0);
     
     console.log('📊 Final Report Summary:');
-    console.log(`  - Total content size: ${totalContentSize} bytes`);
+    console.log(`  - Total content size: ${totalContentSize} characters`);
     console.log(`  - Quotes generated: ${quotesToInsert.length}`);
     console.log(`  - Blueprint version: 1.0 (Standard Personality Report)`);
 
@@ -1,4 +1,3 @@
-import "https://deno.land/x/xhr@0.1.0/mod.ts";
 import { serve } from "https://deno.land/std@0.168.0/http/server.ts";
 import { createClient } from 'https://esm.sh/@supabase/supabase-js@2.7.1';
 import { callChatCompletion } from '../_shared/azure-openai.ts';
@@ -13,7 +12,7 @@ const supabaseServiceKey = Deno.env.get('SUPABASE_SERVICE_ROLE_KEY')!;
 
 serve(async (req) => {
   // ENHANCED LOGGING: Request start
-  const startTime = Date.now();
+  const startTime = performance.now();
   const requestId = crypto.randomUUID().substring(0, 8);
   
   console.log(`🚀 REQUEST START: [${requestId}] Growth conversation request received`, {
@@ -260,7 +259,7 @@ Provide transformational spiritual guidance tailored to their personality. Stay
       question = generateGrowthQuestion(intelligence?.intelligence_level || 50);
     }
 
-    const processingTime = Date.now() - startTime;
+    const processingTime = Math.round(performance.now() - startTime);
     
     console.log(`🌱 GROWTH: [${requestId}] Response generated successfully`, {
       intelligenceBonus,
@@ -290,7 +289,7 @@ Provide transformational spiritual guidance tailored to their personality. Stay
     );
 
   } catch (error) {
-    const processingTime = Date.now() - startTime;
+    const processingTime = Math.round(performance.now() - startTime);
     
     console.error(`❌ REQUEST ERROR: [${requestId}] Critical error in hacs-growth-conversation`, {
       error: error instanceof Error ? error.message : 'Unknown error',
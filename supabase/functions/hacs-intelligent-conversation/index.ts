@@ -1,5 +1,3 @@
-
-import "https://deno.land/x/xhr@0.1.0/mod.ts";
 import { serve } from "https://deno.land/std@0.168.0/http/server.ts";
 import { createClient } from 'https://esm.sh/@supabase/supabase-js@2.45.0';
 import { callChatCompletion } from '../_shared/azure-openai.ts';
@@ -12,77 +10,84 @@ const corsHeaders = {
   'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
 };
 
+// Natural descriptions of each life path number
+const LIFE_PATH_DESCRIPTIONS: Record<number, string> = {
+  1: 'leadership and pioneering independence',
+  2: 'cooperation and diplomatic harmony',
+  3: 'creative expression and communication',
+  4: 'practical building and systematic approach',
+  5: 'freedom-seeking and adventurous change',
+  6: 'nurturing service and responsibility',
+  7: 'spiritual seeking and analytical depth',
+  8: 'material mastery and ambitious achievement',
+  9: 'humanitarian service and universal wisdom',
+  11: 'intuitive illumination and inspired teaching',
+  22: 'master building and visionary manifestation',
+  33: 'compassionate healing and spiritual service'
+};
+
 // Helper function to convert life path numbers to natural descriptions
 function getLifePathDescription(lifePath: number): string {
-  const descriptions: Record<number, string> = {
-    1: 'leadership and pioneering independence',
-    2: 'cooperation and diplomatic harmony',
-    3: 'creative expression and communication',
-    4: 'practical building and systematic approach',
-    5: 'freedom-seeking and adventurous change',
-    6: 'nurturing service and responsibility',
-    7: 'spiritual seeking and analytical depth',
-    8: 'material mastery and ambitious achievement',
-    9: 'humanitarian service and universal wisdom',
-    11: 'intuitive illumination and inspired teaching',
-    22: 'master building and visionary manifestation',
-    33: 'compassionate healing and spiritual service'
-  };
-  return descriptions[lifePath] || 'individual growth and purpose';
+  return LIFE_PATH_DESCRIPTIONS[lifePath] || 'individual growth and purpose';
 }
 
+// Natural descriptions of each MBTI type's thinking style
+const THINKING_STYLE_DESCRIPTIONS: Record<string, string> = {
+  'ENFP': 'creative and inspiring explorer',
+  'INTJ': 'strategic and analytical architect', 
+  'INFP': 'values-driven and empathetic idealist',
+  'INFJ': 'insightful and visionary advocate',
+  'ENTJ': 'confident and natural-born leader',
+  'ISFP': 'gentle and harmonious artist',
+  'ESFP': 'spontaneous and enthusiastic entertainer',
+  'ISFJ': 'warm and dedicated protector',
+  'ESFJ': 'caring and social connector',
+  'ISTP': 'practical and adaptable craftsperson',
+  'ESTP': 'bold and perceptive entrepreneur',
+  'INTP': 'logical and innovative thinker',
+  'ENTP': 'quick-witted and clever innovator',
+  'ISTJ': 'practical and fact-minded logistician',
+  'ESTJ': 'efficient and hardworking executive'
+};
+
 // Helper function to convert MBTI types to natural descriptions
 function getThinkingStyleDescription(mbtiType: string): string {
-  const descriptions: Record<string, string> = {
-    'ENFP': 'creative and inspiring explorer',
-    'INTJ': 'strategic and analytical architect', 
-    'INFP': 'values-driven and empathetic idealist',
-    'ENTP': 'innovative and enthusiastic debater',
-    'INFJ': 'insightful and visionary advocate',
-    'ENTJ': 'confident and natural-born leader',
-    'ISFP': 'gentle and harmonious artist',
-    'ESFP': 'spontaneous and enthusiastic entertainer',
-    'ISFJ': 'warm and dedicated protector',
-    'ESFJ': 'caring and social connector',
-    'ISTP': 'practical and adaptable craftsperson',
-    'ESTP': 'bold and perceptive entrepreneur',
-    'INTP': 'logical and innovative thinker',
-    'ENTP': 'quick-witted and clever innovator',
-    'ISTJ': 'practical and fact-minded logistician',
-    'ESTJ': 'efficient and hardworking executive'
-  };
-  return descriptions[mbtiType] || 'unique and individual thinker';
+  return THINKING_STYLE_DESCRIPTIONS[mbtiType] || 'unique and individual thinker';
 }
 
+// Natural descriptions of each Human Design type's energy
+const ENERGY_DESCRIPTIONS: Record<string, string> = {
+  'Projector': 'invitation-based wisdom sharing',
+  'Generator': 'sustained creative energy flow',
+  'Manifestor': 'independent action and initiation',
+  'Manifesting Generator': 'dynamic multi-passionate energy',
+  'Reflector': 'environment-sensitive reflection and wisdom'
+};
+
 // Helper function to convert Human Design types to natural descriptions
 function getEnergyDescription(hdType: string): string {
-  const descriptions: Record<string, string> = {
-    'Projector': 'invitation-based wisdom sharing',
-    'Generator': 'sustained creative energy flow',
-    'Manifestor': 'independent action and initiation',
-    'Manifesting Generator': 'dynamic multi-passionate energy',
-    'Reflector': 'environment-sensitive reflection and wisdom'
-  };
-  return descriptions[hdType] || 'unique energy expression';
+  return ENERGY_DESCRIPTIONS[hdType] || 'unique energy expression';
 }
 
-// Helper function to convert sun signs to natural descriptions  
+// Natural descriptions of each sun sign's archetype
+const ARCHETYPAL_DESCRIPTIONS: Record<string, string> = {
+  'Aries': 'pioneering and courageous spirit',
+  'Taurus': 'stable and nurturing presence',
+  'Gemini': 'curious and communicative nature',
+  'Cancer': 'intuitive and protective instinct',
+  'Leo': 'creative and confident expression',
+  'Virgo': 'analytical and helpful approach',
+  'Libra': 'harmonious and balanced perspective',
+  'Scorpio': 'intense and transformative depth',
+  'Sagittarius': 'adventurous and philosophical outlook',
+  'Capricorn': 'ambitious and structured methodology',
+  'Aquarius': 'innovative and humanitarian vision',
+  'Pisces': 'empathetic and imaginative flow'
+};
+
+// Helper function to convert sun signs to natural descriptions
 function getArchetypalDescription(sunSign: string): string {
-  const descriptions: Record<string, string> = {
-    'Aries': 'pioneering and courageous spirit',
-    'Taurus': 'stable and nurturing presence',
-    'Gemini': 'curious and communicative nature',
-    'Cancer': 'intuitive and protective instinct',
-    'Leo': 'creative and confident expression',
-    'Virgo': 'analytical and helpful approach',
-    'Libra': 'harmonious and balanced perspective',
-    'Scorpio': 'intense and transformative depth',
-    'Sagittarius': 'adventurous and philosophical outlook',
-    'Capricorn': 'ambitious and structured methodology',
-    'Aquarius': 'innovative and humanitarian vision',
-    'Pisces': 'empathetic and imaginative flow'
-  };
-  return descriptions[sunSign] || 'individual archetypal influence';
+  return ARCHETYPAL_DESCRIPTIONS[sunSign] || 'individual archetypal influence';
 }
 
 // HACS module configuration
@@ -225,7 +230,7 @@ serve(async (req) => {
         
         personalityContext = {
           name: blueprintData.user_meta?.preferred_name || 
-                blueprintData.user_meta?.full_name?.split(' ')[0] || 
+                blueprintData.user_meta?.full_name?.split(' ', 1)[0] || 
                 'friend',
           fullName: blueprintData.user_meta?.full_name,
           // Use the correct path for MBTI from personality assessment
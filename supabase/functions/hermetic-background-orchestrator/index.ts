@@ -1,4 +1,3 @@
-import "https://deno.land/x/xhr@0.1.0/mod.ts";
 import { serve } from "https://deno.land/std@0.168.0/http/server.ts";
 import { createClient } from 'https://esm.sh/@supabase/supabase-js@2';
 import {
@@ -420,7 +419,7 @@ async function processLensObservation(
     : lensBriefFor(agent, label);
 
   const systemPrompt = buildObservationPrompt(label, brief);
-  const userPrompt = `BLUEPRINT:\n${JSON.stringify(blueprint, null, 2)}`;
+  const userPrompt = `BLUEPRINT:\n${JSON.stringify(blueprint)}`;
 
   let report: LensReport | null = null;
   let lastRaw = '';
@@ -490,7 +489,7 @@ async function processCrossFrameworkSynthesis(job: any) {
 
   const raw = await callAgent(
     buildSynthesisPrompt(),
-    `LENS REPORTS:\n${JSON.stringify(lensInput, null, 2)}`,
+    `LENS REPORTS:\n${JSON.stringify(lensInput)}`,
     'cross-framework synthesis',
   );
 
@@ -577,7 +576,7 @@ async function processNarrationSection(job: any, index: number, language: string
 
   const content = await callAgent(
     buildNarrationPrompt(section, userName, getLanguageName(language)),
-    `THE MODEL:\n${JSON.stringify(model, null, 2)}${lensMaterial}`,
+    `THE MODEL:\n${JSON.stringify(model)}${lensMaterial}`,
     section.key,
   );
 
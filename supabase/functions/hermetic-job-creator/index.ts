@@ -1,4 +1,3 @@
-import "https://deno.land/x/xhr@0.1.0/mod.ts";
 import { serve } from "https://deno.land/std@0.168.0/http/server.ts";
 import { createClient } from 'https://esm.sh/@supabase/supabase-js@2';
 
@@ -12,6 +11,8 @@ const corsHeaders = {
   'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
 };
 
+const JSON_HEADERS = { ...corsHeaders, 'Content-Type': 'application/json' };
+
 serve(async (req) => {
   // Handle CORS preflight requests
   if (req.method === 'OPTIONS') {
@@ -30,7 +31,7 @@ serve(async (req) => {
         error: 'Missing user_id or blueprint_data' 
       }), {
         status: 400,
-        headers: { ...corsHeaders, 'Content-Type': 'application/json' }
+        headers: JSON_HEADERS
       });
     }
 
@@ -61,7 +62,7 @@ serve(async (req) => {
             skipped: true,
             reason: 'fresh_report'
           }), {
-            headers: { ...corsHeaders, 'Content-Type': 'application/json' }
+            headers: JSON_HEADERS
           });
         }
       }
@@ -85,7 +86,7 @@ serve(async (req) => {
         skipped: true,
         reason: 'active_job'
       }), {
-        headers: { ...corsHeaders, 'Content-Type': 'application/json' }
+        headers: JSON_HEADERS
       });
     }
     
@@ -109,7 +110,7 @@ serve(async (req) => {
         details: jobError.message 
       }), {
         status: 500,
-        headers: { ...corsHeaders, 'Content-Type': 'application/json' }
+        headers: JSON_HEADERS
       });
     }
     
@@ -152,7 +153,7 @@ serve(async (req) => {
       job_id: job.id,
       message: 'Job created and processing started'
     }), {
-      headers: { ...corsHeaders, 'Content-Type': 'application/json' }
+      headers: JSON_HEADERS
     });
     
   } catch (error) {
@@ -162,7 +163,7 @@ serve(async (req) => {
       details: error.message 
     }), {
       status: 500,
-      headers: { ...corsHeaders, 'Content-Type': 'application/json' }
+      headers: JSON_HEADERS
     });
   }
 });
\ No newline at end of file
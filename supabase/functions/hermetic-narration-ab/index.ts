@@ -192,7 +192,7 @@ serve(async (req) => {
     const bResp = await callChatCompletion({
       messages: [
         { role: 'system', content: findingsPrompt(agent, dimensionLabel) },
-        { role: 'user', content: `BLUEPRINT:\n${JSON.stringify(blueprint, null, 2)}` },
+        { role: 'user', content: `BLUEPRINT:\n${JSON.stringify(blueprint)}` },
       ],
       model: MODEL,
       max_tokens: 1600,
@@ -215,7 +215,7 @@ serve(async (req) => {
       const cResp = await callChatCompletion({
         messages: [
           { role: 'system', content: narrationPrompt(dimensionLabel, userName, language) },
-          { role: 'user', content: `FINDINGS:\n${JSON.stringify(findings, null, 2)}` },
+          { role: 'user', content: `FINDINGS:\n${JSON.stringify(findings)}` },
         ],
         model: MODEL,
         // 1500 words does not fit in 1800 tokens, and Dutch runs richer per
@@ -1,4 +1,3 @@
-import "https://deno.land/x/xhr@0.1.0/mod.ts";
 import { serve } from "https://deno.land/std@0.168.0/http/server.ts";
 import { createClient } from 'https://esm.sh/@supabase/supabase-js@2';
 
@@ -12,6 +11,8 @@ const corsHeaders = {
   'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
 };
 
+const JSON_HEADERS = { ...corsHeaders, 'Content-Type': 'application/json' };
+
 serve(async (req) => {
   // Handle CORS preflight requests
   if (req.method === 'OPTIONS') {
@@ -49,13 +50,13 @@ serve(async (req) => {
       if (heartbeatMs < LIVE_WINDOW_MS) {
         console.log(`⏭️ HERMETIC RECOVERY: job ${jobId} is live (heartbeat ${Math.round(heartbeatMs/1000)}s ago) — skipping resume`);
         return new Response(JSON.stringify({ success: true, resumed: false, reason: 'live', heartbeatAgeSec: Math.round(heartbeatMs/1000) }), {
-          headers: { ...corsHeaders, 'Content-Type': 'application/json' }
+          headers: JSON_HEADERS
         });
       }
       if (heartbeatMs < STALL_WINDOW_MS) {
         console.log(`⏸️ HERMETIC RECOVERY: job ${jobId} within stall grace (${Math.round(heartbeatMs/1000)}s) — not yet resuming`);
         return new Response(JSON.stringify({ success: true, resumed: false, reason: 'grace', heartbeatAgeSec: Math.round(heartbeatMs/1000) }), {
-          headers: { ...corsHeaders, 'Content-Type': 'application/json' }
+          headers: JSON_HEADERS
         });
       }
       console.log(`🔁 HERMETIC RECOVERY: resuming stalled job ${jobId} (last heartbeat ${Math.round(heartbeatMs/1000)}s ago, stage=${job.current_stage}, step=${job.current_step})`);
@@ -66,11 +67,11 @@ serve(async (req) => {
         console.error(`❌ HERMETIC RECOVERY: orchestrator invoke failed for ${jobId}:`, invokeErr);
         return new Response(JSON.stringify({ success: false, resumed: false, error: invokeErr.message }), {
           status: 500,
-          headers: { ...corsHeaders, 'Content-Type': 'application/json' }
+          headers: JSON_HEADERS
         });
       }
       return new Response(JSON.stringify({ success: true, resumed: true, heartbeatAgeSec: Math.round(heartbeatMs/1000) }), {
-        headers: { ...corsHeaders, 'Content-Type': 'application/json' }
+        headers: JSON_HEADERS
       });
     }
 
@@ -101,7 +102,7 @@ serve(async (req) => {
         message: "Report already exists", 
         reportId: existingReport.id 
       }), {
-        headers: { ...corsHeaders, 'Content-Type': 'application/json' }
+        headers: JSON_HEADERS
       });
     }
     
@@ -137,7 +138,7 @@ serve(async (req) => {
         error: 'v3_job_not_recoverable_here',
         message: 'This job used the observation/synthesis/narration pipeline. Its sub-jobs hold structured observations, not prose, so this recovery path would produce a corrupt report. Re-run the orchestrator for this job instead.',
         jobId,
-      }), { status: 409, headers: { ...corsHeaders, 'Content-Type': 'application/json' } });
+      }), { status: 409, headers: JSON_HEADERS });
     }
 
     // Organize sub-jobs by stage
@@ -282,7 +283,7 @@ serve(async (req) => {
       reportId: savedReport.id,
       wordCount: totalWordCount 
     }), {
-      headers: { ...corsHeaders, 'Content-Type': 'application/json' }
+      headers: JSON_HEADERS
     });
     
   } catch (error) {
@@ -292,7 +293,7 @@ serve(async (req) => {
       error: error.message 
     }), {
       status: 500,
-      headers: { ...corsHeaders, 'Content-Type': 'application/json' }
+      headers: JSON_HEADERS
     });
   }
 });
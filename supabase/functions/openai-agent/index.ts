@@ -1,4 +1,3 @@
-import "https://deno.land/x/xhr@0.1.0/mod.ts";
 import { serve } from "https://deno.land/std@0.168.0/http/server.ts";
 import { createClient } from 'https://esm.sh/@supabase/supabase-js@2.7.1';
 import { callChatCompletion } from '../_shared/azure-openai.ts';
@@ -8,6 +7,8 @@ const corsHeaders = {
   'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
 };
 
+const JSON_HEADERS = { ...corsHeaders, 'Content-Type': 'application/json' };
+
 // Tool execution functions
 async function executeTool(toolCall: any, context: any = {}): Promise<any> {
   const { name, arguments: args } = toolCall.function;
@@ -677,14 +678,14 @@ async function handleDecomposeGoal(body: any): Promise<Response> {
     });
     console.log('✅ DECOMPOSE_GOAL: Returning', { milestoneCount: result.milestones.length, ms: Date.now() - startTime });
     return new Response(JSON.stringify(result), {
-      headers: { ...corsHeaders, 'Content-Type': 'application/json' }
+      headers: JSON_HEADERS
     });
   } catch (error) {
     // Return 200 with empty milestones + error so the oracle's fail-path
     // (milestones.length < 3 → no card) handles it without an invoke throw.
     console.error('❌ DECOMPOSE_GOAL failed:', error instanceof Error ? error.message : error);
     return new Response(JSON.stringify({ milestones: [], error: error instanceof Error ? error.message : String(error) }), {
-      headers: { ...corsHeaders, 'Content-Type': 'application/json' }
+      headers: JSON_HEADERS
     });
   }
 }
@@ -826,7 +827,7 @@ serve(async (req) => {
           }
         }), {
           status: 502,  // Bad Gateway - API responded but with invalid content
-          headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+          headers: JSON_HEADERS,
         });
       }
 
@@ -866,7 +867,7 @@ serve(async (req) => {
         error: 'Agent completed but generated no content'
       }), {
         status: 502,  // Bad Gateway - service responded but with invalid content
-        headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+        headers: JSON_HEADERS,
       });
     }
 
@@ -877,7 +878,7 @@ serve(async (req) => {
         error: `Generated content too short: ${finalContent.length} chars (minimum 500 required)`
       }), {
         status: 502,  // Bad Gateway - service responded but with insufficient content
-        headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+        headers: JSON_HEADERS,
       });
     }
 
@@ -890,7 +891,7 @@ serve(async (req) => {
       model_used: data.model,
       total_tokens: data.usage?.total_tokens
     }), {
-      headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+      headers: JSON_HEADERS,
     });
 
   } catch (error) {
@@ -899,7 +900,7 @@ serve(async (req) => {
       error: error.message || 'Failed to process request' 
     }), {
       status: 500,
-      headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+      headers: JSON_HEADERS,
     });
   }
 });
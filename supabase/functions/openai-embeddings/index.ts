@@ -1,12 +1,34 @@
-import "https://deno.land/x/xhr@0.1.0/mod.ts";
 import { serve } from "https://deno.land/std@0.168.0/http/server.ts";
 import { callEmbeddings } from "../_shared/azure-openai.ts";
+import { cachedLookup } from "../_shared/lookup-cache.ts";
 
 const corsHeaders = {
   'Access-Control-Allow-Origin': '*',
   'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
 };
 
+// Embeddings are deterministic for a given input, and the same queries recur
+// (retries, repeated searches), so keep recent ones per isolate
+const EMBEDDING_CACHE_LIMIT = 256;
+const embeddingCache = new Map<string, Promise<number[]>>();
+
+function getEmbedding(query: string): Promise<number[]> {
+  return cachedLookup(embeddingCache, query, () => fetchEmbedding(query), EMBEDDING_CACHE_LIMIT);
+}
+
+async function fetchEmbedding(query: string): Promise<number[]> {
+  const response = await callEmbeddings({ input: query });
+
+  if (!response.ok) {
+    const errorText = await response.text();
+    console.error('❌ Embeddings API error:', response.status, errorText);
+    throw new Error(`Embeddings API error: ${response.status} ${response.statusText}`);
+  }
+
+  const data = await response.json();
+  return data.data[0].embedding;
+}
+
 serve(async (req) => {
   // Handle CORS preflight requests
   if (req.method === 'OPTIONS') {
@@ -22,16 +44,7 @@ serve(async (req) => {
 
     console.log('🔧 Generating embedding for query:', query.substring(0, 100) + '...');
 
-    const response = await callEmbeddings({ input: query });
-
-    if (!response.ok) {
-      const errorText = await response.text();
-      console.error('❌ Embeddings API error:', response.status, errorText);
-      throw new Error(`Embeddings API error: ${response.status} ${response.statusText}`);
-    }
-
-    const data = await response.json();
-    const embedding = data.data[0].embedding;
+    const embedding = await getEmbedding(query);
 
     console.log('✅ Successfully generated embedding, length:', embedding.length);
 
@@ -1,4 +1,3 @@
-import "https://deno.land/x/xhr@0.1.0/mod.ts";
 import { serve } from "https://deno.land/std@0.168.0/http/server.ts";
 import { createClient } from 'https://esm.sh/@supabase/supabase-js@2.7.1'
 
@@ -72,7 +71,7 @@ serve(async (req) => {
 
     // Extract user's first name
     const userName = userMeta?.preferred_name ||
-                     userMeta?.full_name?.split(' ')[0] ||
+                     userMeta?.full_name?.split(' ', 1)[0] ||
                      'Friend';
 
     console.log('👤 User name for quotes:', userName);
@@ -86,7 +86,6 @@ serve(async (req) => {
       JSON.stringify({
         success: false,
         error: error.message,
-        stack: error.stack,
         message: "Failed to test the Swiss Ephemeris API",
         timestamp: new Date().toISOString()
       }),
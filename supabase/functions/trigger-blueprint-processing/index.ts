@@ -1,4 +1,3 @@
-import "https://deno.land/x/xhr@0.1.0/mod.ts";
 import { serve } from "https://deno.land/std@0.168.0/http/server.ts";
 import { createClient } from 'https://esm.sh/@supabase/supabase-js@2.49.4';
 
@@ -7,6 +6,8 @@ const corsHeaders = {
   'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
 };
 
+const JSON_HEADERS = { ...corsHeaders, 'Content-Type': 'application/json' };
+
 serve(async (req) => {
   // Handle CORS preflight requests
   if (req.method === 'OPTIONS') {
@@ -24,7 +25,7 @@ serve(async (req) => {
         error: 'Invalid request body. Expected JSON with userId field.' 
       }), {
         status: 400,
-        headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+        headers: JSON_HEADERS,
       });
     }
 
@@ -37,7 +38,7 @@ serve(async (req) => {
         error: 'Missing required parameter: userId' 
       }), {
         status: 400,
-        headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+        headers: JSON_HEADERS,
       });
     }
     
@@ -53,7 +54,7 @@ serve(async (req) => {
         error: 'Server configuration error' 
       }), {
         status: 500,
-        headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+        headers: JSON_HEADERS,
       });
     }
     
@@ -72,7 +73,7 @@ serve(async (req) => {
         details: error
       }), {
         status: 500,
-        headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+        headers: JSON_HEADERS,
       });
     }
 
@@ -104,7 +105,7 @@ serve(async (req) => {
         preview: e.chunk_content.substring(0, 100) + '...' 
       })) || []
     }), {
-      headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+      headers: JSON_HEADERS,
     });
 
   } catch (error) {
@@ -114,7 +115,7 @@ serve(async (req) => {
       type: error.constructor.name
     }), {
       status: 500,
-      headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+      headers: JSON_HEADERS,
     });
   }
 });
\ No newline at end of file
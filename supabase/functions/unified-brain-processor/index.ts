@@ -1,4 +1,3 @@
-import "https://deno.land/x/xhr@0.1.0/mod.ts";
 import { serve } from "https://deno.land/std@0.168.0/http/server.ts";
 import { createClient } from 'https://esm.sh/@supabase/supabase-js@2.45.0';
 import { callChatCompletion } from '../_shared/azure-openai.ts';
@@ -675,7 +674,7 @@ function extractPersonalityContext(blueprint: any): any {
   if (!blueprint) return null;
   
   return {
-    name: blueprint.user_meta?.preferred_name || blueprint.user_meta?.full_name?.split(' ')[0] || 'User',
+    name: blueprint.user_meta?.preferred_name || blueprint.user_meta?.full_name?.split(' ', 1)[0] || 'User',
     mbti: blueprint.cognition_mbti?.type || blueprint.user_meta?.personality?.likelyType,
     hdType: blueprint.energy_strategy_human_design?.type,
     sunSign: blueprint.archetype_western?.sun_sign